@@ -62,6 +62,7 @@ class DiscoveryStatus(BaseModel):
     multicast_addr: str
     packets_received: int
     packets_invalid: int
+    packets_dropped_kernel: int = 0
     announcements: int
     deletions: int
     sdp_parse_errors: int
@@ -102,7 +103,7 @@ def _stream_to_info(stream: DiscoveredStream) -> StreamInfo:
         channel_order_raw=stream.sdp.channel_order_raw or None,
         origin_ip=stream.origin_ip,
         first_seen=stream.first_seen.isoformat(),
-        last_seen=stream.last_seen.isoformat(),
+        last_seen=stream.last_seen_wall.isoformat(),
         active=stream.active,
         # SMPTE ST 2110-30 fields
         ptp_grandmaster=stream.sdp.ptp_grandmaster or None,
@@ -225,7 +226,7 @@ async def get_stream_sdp(
             return {
                 "stream_id": stream_id,
                 "session_name": stream.sdp.session_name,
-                "sdp": stream.sdp.raw_sdp
+                "sdp": stream.sdp.raw_sdp.decode('utf-8', errors='ignore')
             }
 
     raise HTTPException(status_code=404, detail="Stream not found")
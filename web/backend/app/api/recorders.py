@@ -7,7 +7,7 @@ Copyright: (c) 2026 B. Wynne
 License: GPLv2 or later
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from typing import Optional
 import logging
 import os
@@ -20,7 +20,9 @@ from ..models import (
 )
 from .sources import _sources as available_sources
 from ..services.recorder_manager import get_recorder_manager
-from ..services.config_store import load_recorders_config, save_recorders_config
+from ..services.config_store import (
+    load_recorders_config, save_recorders_config, save_recorders_config_async
+)
 
 logger = logging.getLogger(__name__)
 
@@ -101,9 +103,9 @@ def _load_recorders_from_store():
         logger.info("Initialized default recorder configs")
 
 
-def _save_recorders():
+async def _save_recorders():
     """Save current recorder state to persistent storage."""
-    if not save_recorders_config(_serialize_recorders()):
+    if not await save_recorders_config_async(_serialize_recorders()):
         logger.warning("Failed to persist recorder configs")
 
 
@@ -153,7 +155,7 @@ async def set_active_count(count: int, user: User = Depends(get_current_user)):
             _recorders[i].state = RecorderState.STOPPED
 
     _active_recorder_count = count
-    _save_recorders()  # Persist change
+    await _save_recorders()  # Persist change
     logger.info(f"Active recorder count set to {count} by {user.email}")
 
     return {"active_recorders": _active_recorder_count}
@@ -192,7 +194,7 @@ async def update_recorder_config(
         config.samples_per_packet = source.samples_per_packet
 
     recorder.config = config
-    _save_recorders()  # Persist change
+    await _save_recorders()  # Persist change
     logger.info(f"Recorder {recorder_id} config updated by {user.email}: source_type={config.source_type}")
 
     return {"message": "Configuration updated", "recorder": recorder}
@@ -303,6 +305,19 @@ async def stop_all_recorders(user: User = Depends(get_current_user)):
 async def get_recorder_levels(recorder_id: int, user: User = Depends(get_current_user)):
     """Get current audio levels for a recorder."""
     recorder = get_recorder(recorder_id)
+
+    # Levels from a recording process are serialized once per update by the
+    # recorder manager, so polling clients don't re-serialize them. As for
+    # the level WebSocket, only a recording recorder reports its process's
+    # levels (the manager may also hold monitor or stale ones).
+    if recorder.state == RecorderState.RECORDING:
+        levels_json = get_recorder_manager().get_levels_json(recorder_id)
+        if levels_json is not None:
+            return Response(
+                content=b'{"recorder_id":%d,"levels":%s}' % (recorder_id, levels_json),
+                media_type="application/json"
+            )
+
     return {"recorder_id": recorder_id, "levels": recorder.levels}
 
 
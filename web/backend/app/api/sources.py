@@ -17,7 +17,9 @@ import json
 import re
 
 from ..auth.entra import get_current_user, User
-from ..services.config_store import load_sources_config, save_sources_config
+from ..services.config_store import (
+    load_sources_config, save_sources_config, save_sources_config_async
+)
 
 logger = logging.getLogger(__name__)
 
@@ -224,9 +226,9 @@ def _load_sources_from_store():
         logger.info("Initialized default sources")
 
 
-def _save_sources():
+async def _save_sources():
     """Save current sources to persistent storage."""
-    if not save_sources_config(_serialize_sources()):
+    if not await save_sources_config_async(_serialize_sources()):
         logger.warning("Failed to persist sources config")
 
 
@@ -270,7 +272,7 @@ async def set_active_source(
 
     old_source_id = _active_source_id
     _active_source_id = source_id
-    _save_sources()  # Persist change
+    await _save_sources()  # Persist change
 
     logger.info(f"Source switched from {old_source_id} to {source_id} by {user.email}")
 
@@ -331,7 +333,7 @@ async def create_source(
     )
 
     _sources[source_id] = new_source
-    _save_sources()  # Persist change
+    await _save_sources()  # Persist change
     logger.info(f"Source created: {source_id} by {user.email}")
 
     return new_source
@@ -353,7 +355,7 @@ async def update_source(
     )
 
     _sources[source_id] = updated_source
-    _save_sources()  # Persist change
+    await _save_sources()  # Persist change
     logger.info(f"Source updated: {source_id} by {user.email}")
 
     return updated_source
@@ -375,7 +377,7 @@ async def delete_source(
         )
 
     del _sources[source_id]
-    _save_sources()  # Persist change
+    await _save_sources()  # Persist change
     logger.info(f"Source deleted: {source_id} by {user.email}")
 
     return {"message": "Source deleted"}
@@ -391,7 +393,7 @@ async def enable_source(
         raise HTTPException(status_code=404, detail="Source not found")
 
     _sources[source_id].enabled = True
-    _save_sources()  # Persist change
+    await _save_sources()  # Persist change
     return {"message": "Source enabled", "source": _sources[source_id]}
 
 
@@ -411,7 +413,7 @@ async def disable_source(
         )
 
     _sources[source_id].enabled = False
-    _save_sources()  # Persist change
+    await _save_sources()  # Persist change
     return {"message": "Source disabled", "source": _sources[source_id]}
 
 
@@ -498,7 +500,7 @@ async def create_source_from_discovery(
     )
 
     _sources[source_id] = new_source
-    _save_sources()
+    await _save_sources()
 
     logger.info(f"Source created from discovery: {source_id} ({sdp.session_name}) by {user.email}")
 
@@ -15,8 +15,11 @@ import uuid
 
 from ..auth.entra import get_current_user
 from ..models import Studio, User
-from .recorders import _recorders, get_recorder, _save_recorders
-from ..services.config_store import load_studios_config, save_studios_config
+from .recorders import _recorders, get_recorder, _serialize_recorders
+from ..services.config_store import (
+    load_studios_config, save_studios_config, save_studios_config_async,
+    apply_config_bundle
+)
 
 logger = logging.getLogger(__name__)
 
@@ -105,12 +108,21 @@ def _load_studios_from_store():
         logger.info("Initialized default studios")
 
 
-def _save_studios():
+async def _save_studios():
     """Save current studios to persistent storage."""
-    if not save_studios_config(_serialize_studios()):
+    if not await save_studios_config_async(_serialize_studios()):
         logger.warning("Failed to persist studios config")
 
 
+async def _save_studios_and_recorders():
+    """Save studios and recorder assignments together."""
+    if not await apply_config_bundle({
+        "studios": _serialize_studios(),
+        "recorders": _serialize_recorders()
+    }):
+        logger.warning("Failed to persist studios and recorder configs")
+
+
 def _sync_recorder_assignments():
     """Sync recorder studio_id fields with studio assignments."""
     # Clear all recorder studio assignments
@@ -225,7 +237,7 @@ async def create_studio(
     )
 
     _studios[studio_id] = new_studio
-    _save_studios()  # Persist change
+    await _save_studios()  # Persist change
     logger.info(f"Studio created: {studio_id} by {user.email}")
 
     return new_studio
@@ -250,7 +262,7 @@ async def update_studio(
     if update.enabled is not None:
         studio.enabled = update.enabled
 
-    _save_studios()  # Persist change
+    await _save_studios()  # Persist change
     logger.info(f"Studio updated: {studio_id} by {user.email}")
     return studio
 
@@ -266,8 +278,7 @@ async def delete_studio(studio_id: str, user: User = Depends(get_current_user)):
         _recorders[studio.recorder_id].studio_id = None
 
     del _studios[studio_id]
-    _save_studios()  # Persist change
-    _save_recorders()  # Persist recorder changes
+    await _save_studios_and_recorders()  # Persist studio and recorder changes
     logger.info(f"Studio deleted: {studio_id} by {user.email}")
 
     return {"message": "Studio deleted"}
@@ -305,8 +316,7 @@ async def assign_recorder(
         studio.recorder_id = None
         logger.info(f"Recorder unassigned from {studio_id} by {user.email}")
 
-    _save_studios()  # Persist change
-    _save_recorders()  # Persist recorder changes
+    await _save_studios_and_recorders()  # Persist studio and recorder changes
 
     return studio
 
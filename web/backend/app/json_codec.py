@@ -0,0 +1,26 @@
+"""
+JSON Codec
+
+Fast JSON encode/decode for hot paths (level frames, WebSocket messages).
+
+Uses orjson when installed, otherwise stdlib json with the same calling
+convention: json_loads accepts str or bytes, json_dumps returns compact
+UTF-8 bytes.
+
+Copyright: (c) 2026 B. Wynne
+License: GPLv2 or later
+"""
+
+import json
+
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    # orjson is optional; stdlib json accepts bytes too
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        """Encode obj as compact JSON bytes, matching orjson's output."""
+        return json.dumps(obj, separators=(',', ':')).encode()
@@ -24,6 +24,7 @@ from .api.system import router as system_router
 from .api.discovery import router as discovery_router
 from .websocket.levels import router as ws_router
 from .services.audyn import AudynService
+from .services.process_supervisor import get_process_supervisor
 from .services.recorder_manager import get_recorder_manager
 from .services.sap_discovery import start_sap_service, stop_sap_service
 
@@ -73,6 +74,7 @@ async def lifespan(app: FastAPI):
 
     await recorder_manager.shutdown()
     await audyn_service.shutdown()
+    await get_process_supervisor().shutdown()
 
 
 app = FastAPI(
@@ -11,6 +11,7 @@ from pydantic import BaseModel
 from typing import Optional
 from enum import Enum
 from datetime import datetime
+from dataclasses import dataclass
 
 
 class UserRole(str, Enum):
@@ -58,14 +59,31 @@ class VoxLevelMode(str, Enum):
     ANY = "any"
 
 
-class ChannelLevel(BaseModel):
-    """Audio level for a single channel."""
+@dataclass(slots=True)
+class ChannelLevel:
+    """
+    Audio level for a single channel.
+
+    A slotted dataclass rather than a BaseModel, as one is created per
+    channel for every level frame. Pydantic still validates and
+    serializes it as a field of other models.
+    """
     name: str
     level_db: float = -60.0
     level_linear: float = 0.0
     peak_db: float = -60.0
     clipping: bool = False
 
+    def model_dump(self) -> dict:
+        """Return the level as a dict, like BaseModel.model_dump()."""
+        return {
+            "name": self.name,
+            "level_db": self.level_db,
+            "level_linear": self.level_linear,
+            "peak_db": self.peak_db,
+            "clipping": self.clipping
+        }
+
 
 class RecorderConfig(BaseModel):
     """Configuration for a single recorder."""
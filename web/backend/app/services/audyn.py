@@ -11,19 +11,23 @@ import asyncio
 import subprocess
 import os
 import signal
+import shlex
 import logging
 from typing import Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+from .process_supervisor import get_process_supervisor
+
 logger = logging.getLogger(__name__)
 
-# Path to Audyn binary
+# Path to Audyn binary (fixed for the life of the process, so check it once)
 AUDYN_BIN = os.getenv("AUDYN_BIN", "/usr/bin/audyn")
+_AUDYN_BIN_EXISTS = Path(AUDYN_BIN).exists()
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptureConfig:
     """Capture configuration."""
     source_type: str = "aes67"
@@ -48,7 +52,7 @@ class CaptureConfig:
     ptp_interface: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptureStatus:
     """Current capture status."""
     running: bool = False
@@ -64,7 +68,9 @@ class AudynService:
 
     def __init__(self):
         self._process: Optional[asyncio.subprocess.Process] = None
+        self._pidfd: Optional[int] = None
         self._config: Optional[CaptureConfig] = None
+        self._config_view: Optional[dict] = None
         self._status = CaptureStatus()
         self._monitor_task: Optional[asyncio.Task] = None
 
@@ -72,8 +78,8 @@ class AudynService:
         """Initialize the service."""
         logger.info("AudynService initialized")
 
-        # Check if Audyn binary exists
-        if not Path(AUDYN_BIN).exists():
+        # Binary existence is checked at import
+        if not _AUDYN_BIN_EXISTS:
             logger.warning(f"Audyn binary not found at {AUDYN_BIN}")
 
     async def shutdown(self):
@@ -128,12 +134,14 @@ class AudynService:
             return False
 
         self._config = config
+        self._update_config_view()
 
         # Ensure archive directory exists
         os.makedirs(config.archive_root, exist_ok=True)
 
         cmd = self._build_command(config)
-        logger.info(f"Starting Audyn: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starting Audyn: %s", shlex.join(cmd))
 
         try:
             self._process = await asyncio.create_subprocess_exec(
@@ -148,7 +156,12 @@ class AudynService:
                 start_time=datetime.now()
             )
 
-            # Start monitoring task
+            # Signal via a pidfd so a reused PID can never be hit
+            self._open_pidfd()
+
+            # Exit detection is handled by the shared supervisor;
+            # the monitor task only drains stderr
+            get_process_supervisor().watch(self._process, self._on_process_exit)
             self._monitor_task = asyncio.create_task(self._monitor_process())
 
             logger.info(f"Audyn started with PID {self._process.pid}")
@@ -168,17 +181,21 @@ class AudynService:
         logger.info("Stopping Audyn...")
 
         try:
+            # Deliberate stop: don't report the exit as unexpected
+            get_process_supervisor().unwatch(self._process)
+
             # Send SIGTERM for graceful shutdown
-            self._process.send_signal(signal.SIGTERM)
+            self._send_signal(signal.SIGTERM)
 
             # Wait up to 10 seconds for graceful shutdown
             try:
                 await asyncio.wait_for(self._process.wait(), timeout=10)
             except asyncio.TimeoutError:
                 logger.warning("Audyn didn't stop gracefully, sending SIGKILL")
-                self._process.kill()
+                self._send_signal(signal.SIGKILL)
                 await self._process.wait()
 
+            self._close_pidfd()
             self._status = CaptureStatus(running=False)
             logger.info("Audyn stopped")
             return True
@@ -194,8 +211,9 @@ class AudynService:
             logger.error("No configuration set")
             return False
 
+        # stop_capture() returns once the process has been reaped, so its
+        # multicast socket is already released
         await self.stop_capture()
-        await asyncio.sleep(1)  # Brief pause
         return await self.start_capture(self._config)
 
     async def switch_source(self, multicast_addr: str, port: int = 5004) -> bool:
@@ -206,61 +224,89 @@ class AudynService:
 
         self._config.multicast_addr = multicast_addr
         self._config.port = port
+        self._update_config_view()
 
         if self._status.running:
             return await self.restart_capture()
 
         return True
 
+    def _update_config_view(self):
+        """Rebuild the cached config summary returned by get_status()."""
+        if self._config is None:
+            self._config_view = None
+            return
+
+        self._config_view = {
+            "source_type": self._config.source_type,
+            "multicast_addr": self._config.multicast_addr,
+            "format": self._config.format,
+            "archive_layout": self._config.archive_layout
+        }
+
     async def get_status(self) -> dict:
         """Get current capture status."""
+        status = self._status
         duration = 0
-        if self._status.start_time:
-            duration = int((datetime.now() - self._status.start_time).total_seconds())
+        if status.start_time:
+            duration = int((datetime.now() - status.start_time).total_seconds())
 
         return {
-            "running": self._status.running,
-            "pid": self._status.pid,
-            "start_time": self._status.start_time.isoformat() if self._status.start_time else None,
+            "running": status.running,
+            "pid": status.pid,
+            "start_time": status.start_time.isoformat() if status.start_time else None,
             "duration_seconds": duration,
-            "current_file": self._status.current_file,
-            "bytes_written": self._status.bytes_written,
-            "errors": self._status.errors,
-            "config": {
-                "source_type": self._config.source_type if self._config else None,
-                "multicast_addr": self._config.multicast_addr if self._config else None,
-                "format": self._config.format if self._config else None,
-                "archive_layout": self._config.archive_layout if self._config else None
-            } if self._config else None
+            "current_file": status.current_file,
+            "bytes_written": status.bytes_written,
+            "errors": status.errors,
+            "config": self._config_view
         }
 
+    def _open_pidfd(self):
+        """Open a pidfd for the current process, if supported."""
+        self._close_pidfd()
+        try:
+            self._pidfd = os.pidfd_open(self._process.pid)
+        except (AttributeError, OSError) as e:
+            logger.debug(f"pidfd unavailable, signalling by PID: {e}")
+            self._pidfd = None
+
+    def _close_pidfd(self):
+        """Close the pidfd of the current process."""
+        if self._pidfd is not None:
+            os.close(self._pidfd)
+            self._pidfd = None
+
+    def _send_signal(self, sig: int):
+        """Send a signal to the Audyn process."""
+        if self._pidfd is None:
+            self._process.send_signal(sig)
+            return
+        try:
+            signal.pidfd_send_signal(self._pidfd, sig)
+        except ProcessLookupError:
+            pass  # Already exited
+
+    def _on_process_exit(self, process: asyncio.subprocess.Process):
+        """Supervisor callback: the Audyn process has exited."""
+        if process is not self._process or not self._status.running:
+            return  # Stopped deliberately, or a previous process
+
+        self._close_pidfd()
+
+        logger.warning(f"Audyn process exited with code {process.returncode}")
+        self._status.running = False
+
     async def _monitor_process(self):
-        """Monitor the Audyn process for output and status."""
-        if not self._process:
+        """Log Audyn stderr output until the process closes it."""
+        if not self._process or not self._process.stderr:
             return
 
         try:
-            while self._status.running:
-                # Check if process is still running
-                if self._process.returncode is not None:
-                    logger.warning(f"Audyn process exited with code {self._process.returncode}")
-                    self._status.running = False
-                    break
-
-                # Read stderr for any errors/warnings
-                if self._process.stderr:
-                    try:
-                        line = await asyncio.wait_for(
-                            self._process.stderr.readline(),
-                            timeout=1.0
-                        )
-                        if line:
-                            log_line = line.decode().strip()
-                            logger.info(f"Audyn: {log_line}")
-                    except asyncio.TimeoutError:
-                        pass
-
-                await asyncio.sleep(0.5)
+            # Parks on the pipe until data or EOF; exit is handled by the supervisor
+            async for line in self._process.stderr:
+                log_line = line.decode().strip()
+                logger.info(f"Audyn: {log_line}")
 
         except asyncio.CancelledError:
             pass
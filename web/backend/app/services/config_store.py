@@ -8,14 +8,21 @@ Copyright: (c) 2026 B. Wynne
 License: GPLv2 or later
 """
 
+import asyncio
 import json
 import os
 import logging
 import fcntl
+import threading
+import bisect
+import dataclasses
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 from datetime import datetime
-from copy import deepcopy
+from enum import Enum
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +43,25 @@ CONFIG_FILES = {
     "aes67_network": "aes67_network.json",  # AES67 interface network configuration
 }
 
+# JSON serializers for non-native types, keyed on exact type. Types not
+# listed are resolved once by _resolve_serializer() and memoized here.
+_SERIALIZERS: dict[type, Any] = {
+    datetime: datetime.isoformat,
+}
+
+
+def _resolve_serializer(cls: type) -> Any:
+    """Pick the serializer for a type not yet in _SERIALIZERS."""
+    if issubclass(cls, datetime):
+        return datetime.isoformat
+    if issubclass(cls, Enum):
+        return lambda obj: obj.value
+    if hasattr(cls, 'model_dump'):  # Pydantic model
+        return lambda obj: obj.model_dump()
+    if dataclasses.is_dataclass(cls):  # Includes slotted dataclasses (no __dict__)
+        return dataclasses.asdict
+    return None
+
 
 class ConfigStore:
     """
@@ -48,8 +74,20 @@ class ConfigStore:
     def __init__(self, config_dir: str = None):
         self.config_dir = Path(config_dir or CONFIG_DIR)
         self._ensure_config_dir()
+        self._paths: dict[str, Path] = {
+            name: self.config_dir / filename for name, filename in CONFIG_FILES.items()
+        }
         self._cache: dict[str, Any] = {}
         self._cache_time: dict[str, datetime] = {}
+        # Serializes saves, which may run on executor threads
+        self._save_lock = threading.Lock()
+        # Single worker so async saves land in submission order; a pool
+        # could let an older snapshot be written after a newer one
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-save")
+        # Sorted (oldest first) backup paths per config, validated against
+        # the config directory's stat so external changes are picked up
+        self._backup_index: dict[str, list[Path]] = {}
+        self._backup_index_version: Optional[tuple[int, int, int, int]] = None
 
     def _ensure_config_dir(self):
         """Create config directory if it doesn't exist."""
@@ -62,9 +100,10 @@ class ConfigStore:
 
     def _get_path(self, config_name: str) -> Path:
         """Get the file path for a configuration."""
-        if config_name not in CONFIG_FILES:
-            raise ValueError(f"Unknown config: {config_name}. Valid: {list(CONFIG_FILES.keys())}")
-        return self.config_dir / CONFIG_FILES[config_name]
+        try:
+            return self._paths[config_name]
+        except KeyError:
+            raise ValueError(f"Unknown config: {config_name}. Valid: {list(CONFIG_FILES.keys())}") from None
 
     def load(self, config_name: str, default: Any = None) -> Any:
         """
@@ -72,7 +111,8 @@ class ConfigStore:
 
         Args:
             config_name: Name of the configuration (global, recorders, etc.)
-            default: Default value if file doesn't exist
+            default: Default value if file doesn't exist or is invalid.
+                Returned as-is (not copied), so callers own it.
 
         Returns:
             The configuration data or default value
@@ -80,8 +120,8 @@ class ConfigStore:
         path = self._get_path(config_name)
 
         if not path.exists():
-            logger.debug(f"Config file {path} not found, using default")
-            return deepcopy(default) if default is not None else None
+            logger.debug("Config file %s not found, using default", path)
+            return default
 
         try:
             with open(path, 'r') as f:
@@ -91,16 +131,16 @@ class ConfigStore:
                     data = json.load(f)
                     self._cache[config_name] = data
                     self._cache_time[config_name] = datetime.now()
-                    logger.debug(f"Loaded config: {config_name}")
+                    logger.debug("Loaded config: %s", config_name)
                     return data
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in {path}: {e}")
-            return deepcopy(default) if default is not None else None
+            return default
         except Exception as e:
             logger.error(f"Failed to load config {config_name}: {e}")
-            return deepcopy(default) if default is not None else None
+            return default
 
     def save(self, config_name: str, data: Any) -> bool:
         """
@@ -118,20 +158,28 @@ class ConfigStore:
         path = self._get_path(config_name)
         temp_path = path.with_suffix('.tmp')
 
+        with self._save_lock:
+            return self._save_locked(config_name, path, temp_path, data)
+
+    async def save_async(self, config_name: str, data: Any) -> bool:
+        """
+        Save configuration without blocking the event loop.
+
+        JSON encoding and fsync run on the store's single save thread, so
+        saves are written in the order they were submitted. Callers should
+        pass a snapshot of the data, as it is serialized on another thread.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._save_executor, self.save, config_name, data)
+
+    def _save_locked(self, config_name: str, path: Path, temp_path: Path, data: Any) -> bool:
+        """Write config to temp file and rename into place (caller holds _save_lock)."""
         try:
             # Write to temp file first
-            with open(temp_path, 'w') as f:
-                # Acquire exclusive lock for writing
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    json.dump(data, f, indent=2, default=self._json_serializer)
-                    f.flush()
-                    os.fsync(f.fileno())
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            self._write_temp(temp_path, data)
 
             # Atomic rename
-            os.rename(temp_path, path)
+            os.replace(temp_path, path)
 
             # Update cache
             self._cache[config_name] = data
@@ -142,14 +190,92 @@ class ConfigStore:
 
         except Exception as e:
             logger.error(f"Failed to save config {config_name}: {e}")
-            # Clean up temp file if it exists
-            if temp_path.exists():
-                try:
-                    temp_path.unlink()
-                except:
-                    pass
+            self._remove_temp(temp_path)
             return False
 
+    def save_many(self, updates: dict[str, Any]) -> bool:
+        """
+        Save several configurations together.
+
+        All temp files are written before any is renamed into place, and
+        the config directory is synced once after the renames. If any
+        temp file fails to write, none of the configs are replaced. Each
+        file is then replaced atomically on its own; the batch is not a
+        transaction, so a failed rename can leave earlier files updated.
+
+        Args:
+            updates: Mapping of config name to data
+
+        Returns:
+            True if successful, False otherwise
+        """
+        entries = []
+        for config_name, data in updates.items():
+            path = self._get_path(config_name)
+            entries.append((config_name, path, path.with_suffix('.tmp'), data))
+
+        with self._save_lock:
+            try:
+                for config_name, path, temp_path, data in entries:
+                    self._write_temp(temp_path, data)
+
+                for config_name, path, temp_path, data in entries:
+                    os.replace(temp_path, path)
+                    self._cache[config_name] = data
+                    self._cache_time[config_name] = datetime.now()
+
+                self._fsync_dir()
+
+            except Exception as e:
+                logger.error("Failed to save configs %s: %s", list(updates), e)
+                for _name, _path, temp_path, _data in entries:
+                    self._remove_temp(temp_path)
+                return False
+
+        logger.info("Saved configs: %s", ", ".join(updates))
+        return True
+
+    async def save_many_async(self, updates: dict[str, Any]) -> bool:
+        """Save several configurations on the store's single save thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._save_executor, self.save_many, updates)
+
+    def _write_temp(self, temp_path: Path, data: Any):
+        """Encode data as JSON and write it durably to a temp file."""
+        # Encode up front so the file is written with unbuffered writes
+        payload = json.dumps(data, indent=2, default=self._json_serializer).encode()
+
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            # Acquire exclusive lock for writing
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                # Data (and size) is all we need durable before the rename
+                os.fdatasync(fd)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _remove_temp(self, temp_path: Path):
+        """Clean up temp file if it exists."""
+        if temp_path.exists():
+            try:
+                temp_path.unlink()
+            except:
+                pass
+
+    def _fsync_dir(self):
+        """Make renames in the config directory durable."""
+        dfd = os.open(self.config_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dfd)
+        finally:
+            os.close(dfd)
+
     def delete(self, config_name: str) -> bool:
         """Delete a configuration file."""
         path = self._get_path(config_name)
@@ -172,21 +298,43 @@ class ConfigStore:
         """Check if a configuration file exists."""
         return self._get_path(config_name).exists()
 
+    def get_version(self, config_name: str) -> Optional[tuple[int, int, int]]:
+        """
+        Get a key that changes whenever a configuration file is saved.
+
+        (inode, mtime in nanoseconds, size), or None if missing. The mtime
+        alone can repeat for two saves within one timestamp tick, but every
+        save renames a new file into place, which gets a new inode.
+        """
+        try:
+            st = os.stat(self._get_path(config_name))
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
     def get_cached(self, config_name: str) -> Optional[Any]:
-        """Get cached configuration without reading from disk."""
-        return self._cache.get(config_name)
+        """
+        Get cached configuration without reading from disk.
+
+        Dicts are returned as a read-only view of the cached object.
+        """
+        data = self._cache.get(config_name)
+        if isinstance(data, dict):
+            return MappingProxyType(data)
+        return data
 
     def _json_serializer(self, obj: Any) -> Any:
         """Custom JSON serializer for special types."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if hasattr(obj, 'value'):  # Enum
-            return obj.value
-        if hasattr(obj, 'model_dump'):  # Pydantic model
-            return obj.model_dump()
-        if hasattr(obj, '__dict__'):
-            return obj.__dict__
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+        cls = type(obj)
+        fn = _SERIALIZERS.get(cls)
+        if fn is None:
+            fn = _resolve_serializer(cls)
+            if fn is None:
+                if hasattr(obj, '__dict__'):
+                    return obj.__dict__
+                raise TypeError(f"Object of type {cls} is not JSON serializable")
+            _SERIALIZERS[cls] = fn
+        return fn(obj)
 
     def backup(self, config_name: str) -> Optional[Path]:
         """Create a backup of a configuration file."""
@@ -200,18 +348,59 @@ class ConfigStore:
 
         try:
             import shutil
+            version = self._config_dir_version()
+            index_valid = version is not None and version == self._backup_index_version
             shutil.copy2(path, backup_path)
             logger.info(f"Created backup: {backup_path}")
+
+            # Keep the index in step with our own change
+            if index_valid:
+                index = self._backup_index.get(config_name)
+                if index is not None and backup_path not in index:
+                    bisect.insort(index, backup_path)
+                self._backup_index_version = self._config_dir_version()
             return backup_path
         except Exception as e:
             logger.error(f"Failed to backup config {config_name}: {e}")
             return None
 
     def list_backups(self, config_name: str) -> list[Path]:
-        """List all backups for a configuration."""
+        """List all backups for a configuration (newest first)."""
         path = self._get_path(config_name)
-        pattern = f"{path.stem}.*.bak"
-        return sorted(self.config_dir.glob(pattern), reverse=True)
+
+        # Any change to the directory (ours or external) invalidates the index
+        version = self._config_dir_version()
+        if version is None or version != self._backup_index_version:
+            self._backup_index.clear()
+            self._backup_index_version = version
+
+        index = self._backup_index.get(config_name)
+        if index is None:
+            pattern = f"{path.stem}.*.bak"
+            with os.scandir(self.config_dir) as it:
+                names = [
+                    entry.name for entry in it
+                    if entry.is_file(follow_symlinks=False)
+                    and fnmatch.fnmatchcase(entry.name, pattern)
+                ]
+            index = [self.config_dir / name for name in sorted(names)]
+            self._backup_index[config_name] = index
+
+        return index[::-1]
+
+    def _config_dir_version(self) -> Optional[tuple[int, int, int, int]]:
+        """
+        Get a change token for the config directory.
+
+        (inode, mtime in nanoseconds, link count, size), or None if it
+        can't be read. The mtime alone can miss changes made within the
+        filesystem's timestamp granularity, or a replaced directory.
+        """
+        try:
+            st = os.stat(self.config_dir)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_nlink, st.st_size)
 
 
 # Singleton instance
@@ -228,6 +417,11 @@ def get_config_store() -> ConfigStore:
 
 # Convenience functions for common operations
 
+async def apply_config_bundle(updates: dict[str, Any]) -> bool:
+    """Save several configurations together, off the event loop."""
+    return await get_config_store().save_many_async(updates)
+
+
 def load_global_config() -> Optional[dict]:
     """Load global capture configuration."""
     return get_config_store().load("global")
@@ -248,6 +442,11 @@ def save_recorders_config(recorders: dict) -> bool:
     return get_config_store().save("recorders", recorders)
 
 
+async def save_recorders_config_async(recorders: dict) -> bool:
+    """Save recorder configurations off the event loop."""
+    return await get_config_store().save_async("recorders", recorders)
+
+
 def load_studios_config() -> Optional[dict]:
     """Load studio configurations."""
     return get_config_store().load("studios")
@@ -258,6 +457,11 @@ def save_studios_config(studios: dict) -> bool:
     return get_config_store().save("studios", studios)
 
 
+async def save_studios_config_async(studios: dict) -> bool:
+    """Save studio configurations off the event loop."""
+    return await get_config_store().save_async("studios", studios)
+
+
 def load_sources_config() -> Optional[dict]:
     """Load AES67 source configurations."""
     return get_config_store().load("sources")
@@ -268,6 +472,11 @@ def save_sources_config(sources: dict) -> bool:
     return get_config_store().save("sources", sources)
 
 
+async def save_sources_config_async(sources: dict) -> bool:
+    """Save AES67 source configurations off the event loop."""
+    return await get_config_store().save_async("sources", sources)
+
+
 def load_auth_config() -> Optional[dict]:
     """Load authentication configuration."""
     return get_config_store().load("auth")
@@ -0,0 +1,128 @@
+"""
+Process Supervisor Service
+
+Watches child process exits for all services on a single task.
+
+Each watched child gets a pidfd registered with the event loop; when the
+child exits its pidfd becomes readable and the child is queued for the
+supervisor task, which reaps it and invokes the owner's exit handler.
+Where pidfds are unavailable, a per-child wait() feeds the same queue.
+
+Copyright: (c) 2026 B. Wynne
+License: GPLv2 or later
+"""
+
+import asyncio
+import os
+import logging
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+ExitHandler = Callable[[asyncio.subprocess.Process], None]
+
+
+class ProcessSupervisor:
+    """Fans in exit notifications from many child processes."""
+
+    def __init__(self):
+        # pid -> (process, pidfd or None, exit handler)
+        self._children: dict[int, tuple[asyncio.subprocess.Process, Optional[int], ExitHandler]] = {}
+        self._exited: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def watch(self, process: asyncio.subprocess.Process, on_exit: ExitHandler):
+        """Call on_exit(process) once the process has exited and been reaped."""
+        loop = asyncio.get_running_loop()
+        if self._exited is None:
+            self._exited = asyncio.Queue()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        pid = process.pid
+        pidfd = None
+        try:
+            pidfd = os.pidfd_open(pid)
+            loop.add_reader(pidfd, self._on_pidfd_readable, pid)
+        except (AttributeError, OSError) as e:
+            # No pidfd support, or the child has already been reaped
+            logger.debug("pidfd unavailable for PID %s (%s), using wait()", pid, e)
+            if pidfd is not None:
+                os.close(pidfd)
+                pidfd = None
+            waiter = asyncio.create_task(process.wait())
+            waiter.add_done_callback(lambda _t: self._exited.put_nowait(pid))
+
+        self._children[pid] = (process, pidfd, on_exit)
+
+    def unwatch(self, process: asyncio.subprocess.Process):
+        """Stop watching a process without calling its exit handler."""
+        entry = self._children.pop(process.pid, None)
+        if entry:
+            self._close_pidfd(entry[1])
+
+    async def shutdown(self):
+        """Stop the supervisor task and release all pidfds."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for _process, pidfd, _on_exit in self._children.values():
+            self._close_pidfd(pidfd)
+        self._children.clear()
+
+    def _on_pidfd_readable(self, pid: int):
+        """Event loop callback: a watched child has exited."""
+        entry = self._children.get(pid)
+        if entry and entry[1] is not None:
+            # pidfds stay readable after exit, so stop polling immediately
+            asyncio.get_running_loop().remove_reader(entry[1])
+        self._exited.put_nowait(pid)
+
+    def _close_pidfd(self, pidfd: Optional[int]):
+        """Unregister and close a pidfd."""
+        if pidfd is None:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(pidfd)
+        except RuntimeError:
+            pass
+        os.close(pidfd)
+
+    async def _run(self):
+        """Dispatch exit handlers for children as they exit."""
+        try:
+            while True:
+                pid = await self._exited.get()
+                entry = self._children.pop(pid, None)
+                if entry is None:
+                    continue  # Unwatched meanwhile
+
+                process, pidfd, on_exit = entry
+                self._close_pidfd(pidfd)
+
+                # Child has exited; this only waits for the reap
+                await process.wait()
+                try:
+                    on_exit(process)
+                except Exception as e:
+                    logger.error(f"Exit handler error for PID {pid}: {e}")
+
+        except asyncio.CancelledError:
+            pass
+
+
+# Singleton instance
+_supervisor: Optional[ProcessSupervisor] = None
+
+
+def get_process_supervisor() -> ProcessSupervisor:
+    """Get the process supervisor singleton."""
+    global _supervisor
+    if _supervisor is None:
+        _supervisor = ProcessSupervisor()
+    return _supervisor
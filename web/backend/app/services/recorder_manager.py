@@ -12,34 +12,135 @@ import subprocess
 import os
 import signal
 import logging
-import json
+import math
+import shlex
+from collections import defaultdict
 from typing import Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+from ..json_codec import json_loads, json_dumps
 from ..models import RecorderConfig, SourceType, ChannelLevel
-from ..services.config_store import load_global_config
+from ..services.config_store import get_config_store, load_global_config
+from ..services.process_supervisor import get_process_supervisor
 from ..api.control import CaptureConfig
 
+# Level frame schema and decoder, built once at import and shared by all
+# recorders. msgspec decodes straight into the typed struct; without it the
+# frame is parsed as JSON and converted to the same shape.
+try:
+    import msgspec
+
+    class _ChannelMsg(msgspec.Struct):
+        rms_db: float = -60.0
+        peak_db: float = -60.0
+        clipping: bool = False
+
+    class _LevelsMsg(msgspec.Struct):
+        channels: int = 2
+        left: Optional[_ChannelMsg] = None
+        right: Optional[_ChannelMsg] = None
+
+    _decode_levels = msgspec.json.Decoder(_LevelsMsg).decode
+
+except ImportError:
+    @dataclass(slots=True)
+    class _ChannelMsg:
+        rms_db: float = -60.0
+        peak_db: float = -60.0
+        clipping: bool = False
+
+    @dataclass(slots=True)
+    class _LevelsMsg:
+        channels: int = 2
+        left: Optional[_ChannelMsg] = None
+        right: Optional[_ChannelMsg] = None
+
+    def _channel_msg(data: Optional[dict]) -> Optional[_ChannelMsg]:
+        if data is None:
+            return None
+        return _ChannelMsg(
+            rms_db=data.get("rms_db", -60.0),
+            peak_db=data.get("peak_db", -60.0),
+            clipping=data.get("clipping", False)
+        )
+
+    def _decode_levels(line: bytes) -> _LevelsMsg:
+        data = json_loads(line)
+        return _LevelsMsg(
+            channels=data.get("channels", 2),
+            left=_channel_msg(data.get("left")),
+            right=_channel_msg(data.get("right"))
+        )
+
 logger = logging.getLogger(__name__)
 
 
+# Parsed global config, reused until global.json is replaced on disk
+_global_cfg: Optional[CaptureConfig] = None
+_global_cfg_version: Optional[tuple[int, int, int]] = None
+
+
 def get_global_config():
-    """Get the current global config fresh from the config store."""
+    """Get the current global config, reparsed only when the file changes."""
+    global _global_cfg, _global_cfg_version
+
+    version = get_config_store().get_version("global")
+    if version is not None and version == _global_cfg_version:
+        return _global_cfg
+
+    cfg = None
     saved = load_global_config()
     if saved:
         try:
-            return CaptureConfig(**saved)
+            cfg = CaptureConfig(**saved)
         except Exception as e:
-            logger.error(f"Failed to parse global config: {e}")
-            return None
-    return None
+            logger.error("Failed to parse global config: %s", e)
+
+    _global_cfg, _global_cfg_version = cfg, version
+    return cfg
+
+
+# dB -> linear amplitude for the 0.1 dB steps audyn reports, -60.0..0.0 dB
+_DB_LUT = tuple(10 ** (i / 200) for i in range(-600, 1))
+
+
+def _db_to_linear(db: float) -> float:
+    """Convert a level in dB to linear amplitude."""
+    if not math.isfinite(db):
+        # round() raises on inf and NaN; -inf is digital silence
+        if db > 0:
+            return math.pow(10, db / 20)
+        return 0.0
+    idx = round(db * 10) + 600
+    if 0 <= idx <= 600:
+        return _DB_LUT[idx]
+    return math.pow(10, db / 20)
+
 
 # Path to Audyn binary - check for mock first, then real
 MOCK_AUDYN = Path(__file__).parent.parent.parent / "scripts" / "mock_audyn.sh"
 AUDYN_BIN = os.getenv("AUDYN_BIN", str(MOCK_AUDYN) if MOCK_AUDYN.exists() else "/usr/bin/audyn")
 
+# StreamReader buffer for child stdout/stderr (asyncio default is 64 KiB)
+STREAM_LIMIT = 1024 * 1024
+
+# Recorder ids are small dense integers (1-6 in the API), so processes are
+# kept in a fixed slot list indexed by id
+MAX_RECORDER_SLOTS = 64
+
+
+class _ShellCommand:
+    """Formats a command line with shlex.join, only if it is actually logged."""
+    __slots__ = ("cmd",)
+
+    def __init__(self, cmd: list[str]):
+        self.cmd = cmd
+
+    def __str__(self) -> str:
+        return shlex.join(self.cmd)
+
 
 @dataclass
 class RecorderProcess:
@@ -49,9 +150,9 @@ class RecorderProcess:
     config: Optional[RecorderConfig] = None
     start_time: Optional[datetime] = None
     current_file: Optional[str] = None
-    monitor_task: Optional[asyncio.Task] = None
-    stdout_task: Optional[asyncio.Task] = None
-    levels: list = field(default_factory=list)  # Current audio levels
+    monitor_task: Optional[asyncio.Task] = None  # Pumps stdout (levels) and stderr (logs)
+    levels: list = field(default_factory=lambda: [None, None])  # Current L/R levels, updated in place
+    levels_json: Optional[bytes] = None  # levels serialized once per update, None if no channels
 
 
 @dataclass
@@ -61,44 +162,52 @@ class MonitorProcess:
     process: Optional[asyncio.subprocess.Process] = None
     config: Optional[RecorderConfig] = None
     stdout_task: Optional[asyncio.Task] = None
-    levels: list = field(default_factory=list)
+    levels: list = field(default_factory=lambda: [None, None])
+    levels_json: Optional[bytes] = None
 
 
 class RecorderManager:
     """Manages multiple recorder processes."""
 
     def __init__(self):
-        self._processes: dict[int, RecorderProcess] = {}
+        self._processes: list[Optional[RecorderProcess]] = [None] * MAX_RECORDER_SLOTS
         self._monitors: dict[int, MonitorProcess] = {}  # Level monitoring processes
-        self._lock = asyncio.Lock()
+        # One lock per recorder id, shared by its recorder and monitor, so a
+        # slow stop on one recorder doesn't hold up the others. _processes and
+        # _monitors need no lock: they're only mutated between awaits.
+        self._locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Archive timing args keyed on (layout, period, clock); shared by all recorders
+        self._base_cmd_cache: dict[tuple, tuple[str, ...]] = {}
+        # Environment and binary location don't change at runtime
+        self._default_archive_base = os.getenv("AUDYN_ARCHIVE_ROOT", "/var/lib/audyn/archive")
+        self._audyn_bin_exists = Path(AUDYN_BIN).exists()
 
     async def initialize(self):
         """Initialize the manager."""
-        logger.info(f"RecorderManager initialized. Using binary: {AUDYN_BIN}")
-        if not Path(AUDYN_BIN).exists():
-            logger.warning(f"Audyn binary not found at {AUDYN_BIN}")
+        logger.info("RecorderManager initialized. Using binary: %s", AUDYN_BIN)
+        if not self._audyn_bin_exists:
+            logger.warning("Audyn binary not found at %s", AUDYN_BIN)
 
     async def shutdown(self):
         """Shutdown all recorders and monitors."""
         for recorder_id in list(self._monitors.keys()):
             await self.stop_monitor(recorder_id)
-        for recorder_id in list(self._processes.keys()):
-            await self.stop_recorder(recorder_id)
+        for recorder_id, proc in enumerate(self._processes):
+            if proc is not None:
+                await self.stop_recorder(recorder_id)
         logger.info("RecorderManager shutdown complete")
 
-    def _build_command(self, recorder_id: int, config: RecorderConfig, studio_id: str = None) -> list[str]:
+    def _build_command(self, recorder_id: int, config: RecorderConfig,
+                       global_cfg: Optional[CaptureConfig], studio_id: str = None) -> list[str]:
         """Build command line for recorder."""
         cmd = [AUDYN_BIN]
 
-        # Load global config once for all settings
-        global_cfg = get_global_config()
-
         # Use global settings from Settings tab for archive config
         # Fall back to recorder config if global not set
         archive_layout = "dailydir"
         archive_period = 3600
         archive_clock = "localtime"
-        archive_base = os.getenv("AUDYN_ARCHIVE_ROOT", "/var/lib/audyn/archive")
+        archive_base = self._default_archive_base
 
         if global_cfg:
             archive_layout = global_cfg.archive_layout.value if global_cfg.archive_layout else "dailydir"
@@ -113,9 +222,18 @@ class RecorderManager:
             archive_root = f"{archive_base}/recorder{recorder_id}"
 
         cmd.extend(["--archive-root", archive_root])
-        cmd.extend(["--archive-layout", archive_layout])
-        cmd.extend(["--archive-period", str(archive_period)])
-        cmd.extend(["--archive-clock", archive_clock])
+
+        # The archive timing args only change with the global config
+        key = (archive_layout, archive_period, archive_clock)
+        base = self._base_cmd_cache.get(key)
+        if base is None:
+            base = (
+                "--archive-layout", archive_layout,
+                "--archive-period", str(archive_period),
+                "--archive-clock", archive_clock,
+            )
+            self._base_cmd_cache[key] = base
+        cmd.extend(base)
         cmd.extend(["--archive-suffix", config.format.value if config.format else "wav"])
 
         # Source configuration
@@ -160,15 +278,18 @@ class RecorderManager:
 
     async def start_recorder(self, recorder_id: int, config: RecorderConfig, studio_id: str = None) -> bool:
         """Start a recorder process."""
-        async with self._lock:
-            if recorder_id in self._processes:
-                proc = self._processes[recorder_id]
-                if proc.process and proc.process.returncode is None:
-                    logger.warning(f"Recorder {recorder_id} already running")
-                    return False
+        if not 0 <= recorder_id < MAX_RECORDER_SLOTS:
+            logger.error("Recorder id %d out of range", recorder_id)
+            return False
+
+        async with self._locks[recorder_id]:
+            proc = self._processes[recorder_id]
+            if proc and proc.process and proc.process.returncode is None:
+                logger.warning("Recorder %d already running", recorder_id)
+                return False
 
             # Use global archive root from Settings, fall back to default
-            archive_base = os.getenv("AUDYN_ARCHIVE_ROOT", "/var/lib/audyn/archive")
+            archive_base = self._default_archive_base
             global_cfg = get_global_config()
             if global_cfg and global_cfg.archive_root:
                 archive_base = global_cfg.archive_root
@@ -182,14 +303,15 @@ class RecorderManager:
             # Ensure archive directory exists
             os.makedirs(archive_root, exist_ok=True)
 
-            cmd = self._build_command(recorder_id, config, studio_id)
-            logger.info(f"Starting recorder {recorder_id}: {' '.join(cmd)}")
+            cmd = self._build_command(recorder_id, config, global_cfg, studio_id)
+            logger.info("Starting recorder %d: %s", recorder_id, _ShellCommand(cmd))
 
             try:
                 process = await asyncio.create_subprocess_exec(
                     *cmd,
                     stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=STREAM_LIMIT
                 )
 
                 rec_proc = RecorderProcess(
@@ -199,192 +321,254 @@ class RecorderManager:
                     start_time=datetime.now()
                 )
 
-                # Start monitor task (stderr)
+                # Single task for level data (stdout) and logs (stderr)
                 rec_proc.monitor_task = asyncio.create_task(
-                    self._monitor_process(recorder_id)
-                )
-
-                # Start stdout reader for level data
-                rec_proc.stdout_task = asyncio.create_task(
-                    self._read_levels(recorder_id)
+                    self._pump_io(recorder_id)
                 )
 
                 self._processes[recorder_id] = rec_proc
-                logger.info(f"Recorder {recorder_id} started with PID {process.pid}")
+
+                # Woken on exit via pidfd rather than polling returncode
+                get_process_supervisor().watch(
+                    process, lambda p, rid=recorder_id: self._on_recorder_exit(rid, p)
+                )
+                logger.info("Recorder %d started with PID %s", recorder_id, process.pid)
                 return True
 
             except Exception as e:
-                logger.error(f"Failed to start recorder {recorder_id}: {e}")
+                logger.error("Failed to start recorder %d: %s", recorder_id, e)
                 return False
 
     async def stop_recorder(self, recorder_id: int) -> bool:
         """Stop a recorder process."""
-        async with self._lock:
-            if recorder_id not in self._processes:
-                logger.warning(f"Recorder {recorder_id} not running")
+        async with self._locks[recorder_id]:
+            proc = self._get_process(recorder_id)
+            if proc is None:
+                logger.warning("Recorder %d not running", recorder_id)
                 return False
 
-            proc = self._processes[recorder_id]
             if not proc.process:
-                del self._processes[recorder_id]
+                self._processes[recorder_id] = None
                 return True
 
-            logger.info(f"Stopping recorder {recorder_id}...")
+            logger.info("Stopping recorder %d...", recorder_id)
 
             try:
-                # Cancel monitor tasks
+                # Deliberate stop: don't report the exit as unexpected
+                get_process_supervisor().unwatch(proc.process)
+
+                # Cancel I/O task
                 if proc.monitor_task:
                     proc.monitor_task.cancel()
-                if proc.stdout_task:
-                    proc.stdout_task.cancel()
 
-                # Send SIGTERM for graceful shutdown
-                proc.process.send_signal(signal.SIGTERM)
+                # SIGTERM for graceful shutdown, wait up to 5 seconds
+                if not await self._terminate(proc.process, timeout=5):
+                    logger.warning("Recorder %d didn't stop gracefully, killed", recorder_id)
 
-                # Wait up to 5 seconds
-                try:
-                    await asyncio.wait_for(proc.process.wait(), timeout=5)
-                except asyncio.TimeoutError:
-                    logger.warning(f"Recorder {recorder_id} didn't stop gracefully, killing")
-                    proc.process.kill()
-                    await proc.process.wait()
-
-                del self._processes[recorder_id]
-                logger.info(f"Recorder {recorder_id} stopped")
+                self._processes[recorder_id] = None
+                logger.info("Recorder %d stopped", recorder_id)
                 return True
 
             except Exception as e:
-                logger.error(f"Error stopping recorder {recorder_id}: {e}")
+                logger.error("Error stopping recorder %d: %s", recorder_id, e)
                 return False
 
+    def _on_recorder_exit(self, recorder_id: int, process: asyncio.subprocess.Process):
+        """Supervisor callback: a recorder process exited without being stopped."""
+        logger.warning("Recorder %d process exited with code %s", recorder_id, process.returncode)
+
+    @staticmethod
+    async def _terminate(process: asyncio.subprocess.Process, timeout: float) -> bool:
+        """
+        Send SIGTERM and wait for the process to exit, killing it after timeout.
+
+        Returns False if the process had to be killed.
+        """
+        if process.returncode is not None:
+            return True  # Already exited and reaped
+        try:
+            process.send_signal(signal.SIGTERM)
+        except ProcessLookupError:
+            return True  # Exited but not yet reaped
+
+        # wait() wakes as soon as the child exits; the timeout only bounds it
+        try:
+            await asyncio.wait_for(process.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return False
+
+    def _get_process(self, recorder_id: int) -> Optional[RecorderProcess]:
+        """Get the tracked process for a recorder id, or None."""
+        if 0 <= recorder_id < MAX_RECORDER_SLOTS:
+            return self._processes[recorder_id]
+        return None
+
     def is_running(self, recorder_id: int) -> bool:
         """Check if a recorder is running."""
-        if recorder_id not in self._processes:
+        proc = self._get_process(recorder_id)
+        if proc is None:
             return False
-        proc = self._processes[recorder_id]
         return proc.process is not None and proc.process.returncode is None
 
     def get_process_info(self, recorder_id: int) -> Optional[dict]:
         """Get info about a running recorder process."""
-        if recorder_id not in self._processes:
+        proc = self._get_process(recorder_id)
+        if proc is None:
             return None
 
-        proc = self._processes[recorder_id]
         return {
             "pid": proc.process.pid if proc.process else None,
             "start_time": proc.start_time.isoformat() if proc.start_time else None,
             "running": proc.process.returncode is None if proc.process else False
         }
 
-    async def _monitor_process(self, recorder_id: int):
-        """Monitor a recorder process for output and status."""
-        if recorder_id not in self._processes:
+    async def _pump_io(self, recorder_id: int):
+        """Read level JSON from stdout and logs from stderr until both close."""
+        proc = self._get_process(recorder_id)
+        if proc is None or not proc.process:
             return
 
-        proc = self._processes[recorder_id]
-        if not proc.process:
-            return
+        stdout = proc.process.stdout
+        stderr = proc.process.stderr
+        pending: dict[asyncio.Future, asyncio.StreamReader] = {}
+        carry = b''
+
+        def arm(stream: asyncio.StreamReader):
+            # stdout is read in bulk so a burst of level frames costs one wakeup
+            if stream is stdout:
+                fut = asyncio.ensure_future(stream.read(STREAM_LIMIT))
+            else:
+                fut = asyncio.ensure_future(stream.readline())
+            pending[fut] = stream
 
         try:
-            while proc.process.returncode is None:
-                # Read stderr for logs
-                if proc.process.stderr:
-                    try:
-                        line = await asyncio.wait_for(
-                            proc.process.stderr.readline(),
-                            timeout=1.0
-                        )
-                        if line:
-                            log_line = line.decode().strip()
-                            logger.debug(f"Recorder {recorder_id}: {log_line}")
-                    except asyncio.TimeoutError:
-                        pass
-
-                await asyncio.sleep(0.5)
-
-            # Process exited
-            logger.warning(f"Recorder {recorder_id} process exited with code {proc.process.returncode}")
+            for stream in (stdout, stderr):
+                if stream:
+                    arm(stream)
 
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            logger.error(f"Monitor error for recorder {recorder_id}: {e}")
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
 
-    async def _read_levels(self, recorder_id: int):
-        """Read and parse level JSON from stdout."""
-        if recorder_id not in self._processes:
-            return
+                for fut in done:
+                    stream = pending.pop(fut)
+                    data = fut.result()
+                    if not data:
+                        continue  # EOF on this stream, don't re-arm
 
-        proc = self._processes[recorder_id]
-        if not proc.process or not proc.process.stdout:
-            return
+                    if stream is stdout:
+                        lines, carry = self._split_lines(carry, data)
+                        levels = self._latest_levels(lines)
+                        if levels is not None:
+                            self._update_levels(proc, levels)
+                    elif logger.isEnabledFor(logging.DEBUG):
+                        # Only decode stderr when it will actually be logged
+                        logger.debug("Recorder %d: %s", recorder_id, data.decode(errors='replace').strip())
 
-        try:
-            while proc.process.returncode is None:
-                try:
-                    line = await asyncio.wait_for(
-                        proc.process.stdout.readline(),
-                        timeout=1.0
-                    )
-                    if line:
-                        line_str = line.decode().strip()
-                        if line_str.startswith('{') and '"type":"levels"' in line_str:
-                            try:
-                                data = json.loads(line_str)
-                                self._update_levels(recorder_id, data)
-                            except json.JSONDecodeError:
-                                pass
-                except asyncio.TimeoutError:
-                    pass
-
-                await asyncio.sleep(0.01)  # Small yield
+                    arm(stream)
+
+            # Both streams closed; the exit itself is reported by the supervisor
 
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            logger.error(f"Level reader error for recorder {recorder_id}: {e}")
-
-    def _update_levels(self, recorder_id: int, data: dict):
-        """Update stored levels for a recorder from JSON data."""
-        if recorder_id not in self._processes:
-            return
-
-        proc = self._processes[recorder_id]
-        channels = data.get("channels", 2)
-        levels = []
-
-        if "left" in data:
-            left = data["left"]
-            levels.append(ChannelLevel(
+            logger.error("I/O error for recorder %d: %s", recorder_id, e)
+        finally:
+            for fut in pending:
+                fut.cancel()
+
+    @staticmethod
+    def _latest_levels(lines: list[bytes]) -> Optional[_LevelsMsg]:
+        """
+        Parse the most recent level frame in a batch of stdout lines.
+
+        Levels are a running signal, so older frames in the same batch are
+        stale and are skipped without being parsed.
+        """
+        for line in reversed(lines):
+            # Check the raw bytes; no decode needed for level frames
+            if line.startswith(b'{') and b'"type":"levels"' in line:
+                try:
+                    return _decode_levels(line)
+                except (ValueError, AttributeError):
+                    continue  # Malformed JSON or unexpected shape
+        return None
+
+    @staticmethod
+    def _split_lines(carry: bytes, chunk: bytes) -> tuple[list[bytes], bytes]:
+        """Split a stdout chunk into complete lines plus the trailing partial line."""
+        lines = (carry + chunk).split(b'\n')
+        carry = lines.pop()
+        if len(carry) > STREAM_LIMIT:
+            carry = b''  # Not level output; don't let it grow unbounded
+        return lines, carry
+
+    def _update_levels(self, proc: RecorderProcess, msg: _LevelsMsg):
+        """Update stored levels for a recorder from a level frame."""
+        self._fill_levels(proc.levels, msg)
+        proc.levels_json = self._encode_levels(proc.levels)
+
+    @staticmethod
+    def _fill_levels(levels: list, msg: _LevelsMsg):
+        """Write L/R levels from a level frame into a 2-slot list in place."""
+        left = msg.left
+        if left is not None:
+            levels[0] = ChannelLevel(
                 name="L",
-                level_db=left.get("rms_db", -60),
-                level_linear=10 ** (left.get("rms_db", -60) / 20),
-                peak_db=left.get("peak_db", -60),
-                clipping=left.get("clipping", False)
-            ))
-
-        if "right" in data and channels >= 2:
-            right = data["right"]
-            levels.append(ChannelLevel(
-                name="R",
-                level_db=right.get("rms_db", -60),
-                level_linear=10 ** (right.get("rms_db", -60) / 20),
-                peak_db=right.get("peak_db", -60),
-                clipping=right.get("clipping", False)
-            ))
+                level_db=left.rms_db,
+                level_linear=_db_to_linear(left.rms_db),
+                peak_db=left.peak_db,
+                clipping=left.clipping
+            )
+        else:
+            levels[0] = None
 
-        proc.levels = levels
+        right = msg.right
+        if right is not None and msg.channels >= 2:
+            levels[1] = ChannelLevel(
+                name="R",
+                level_db=right.rms_db,
+                level_linear=_db_to_linear(right.rms_db),
+                peak_db=right.peak_db,
+                clipping=right.clipping
+            )
+        else:
+            levels[1] = None
+
+    @staticmethod
+    def _encode_levels(levels: list) -> Optional[bytes]:
+        """Serialize the present channels of a level slot list to JSON bytes."""
+        channels = [l.model_dump() for l in levels if l is not None]
+        return json_dumps(channels) if channels else None
+
+    def get_levels_json(self, recorder_id: int) -> Optional[bytes]:
+        """
+        Get current audio levels as pre-serialized JSON bytes.
+
+        Same source preference as get_levels(); returns None when no levels
+        are available.
+        """
+        proc = self._get_process(recorder_id)
+        if proc and proc.levels_json is not None:
+            return proc.levels_json
+        mon = self._monitors.get(recorder_id)
+        if mon:
+            return mon.levels_json
+        return None
 
     def get_levels(self, recorder_id: int) -> list:
         """Get current audio levels for a recorder (from recording or monitor)."""
         # Prefer recording process levels if running
-        if recorder_id in self._processes:
-            levels = self._processes[recorder_id].levels
+        proc = self._get_process(recorder_id)
+        if proc is not None:
+            levels = [l for l in proc.levels if l is not None]
             if levels:
                 return levels
         # Fall back to monitor levels
         if recorder_id in self._monitors:
-            return self._monitors[recorder_id].levels
+            return [l for l in self._monitors[recorder_id].levels if l is not None]
         return []
 
     def _build_monitor_command(self, config: RecorderConfig) -> list[str]:
@@ -421,13 +605,12 @@ class RecorderManager:
 
     async def start_monitor(self, recorder_id: int, config: RecorderConfig) -> bool:
         """Start level monitoring for a recorder (without recording)."""
-        async with self._lock:
+        async with self._locks[recorder_id]:
             # Don't start monitor if already recording
-            if recorder_id in self._processes:
-                proc = self._processes[recorder_id]
-                if proc.process and proc.process.returncode is None:
-                    logger.debug(f"Recorder {recorder_id} is recording, skipping monitor")
-                    return False
+            proc = self._get_process(recorder_id)
+            if proc and proc.process and proc.process.returncode is None:
+                logger.debug("Recorder %d is recording, skipping monitor", recorder_id)
+                return False
 
             # Don't start if monitor already running
             if recorder_id in self._monitors:
@@ -436,13 +619,14 @@ class RecorderManager:
                     return True  # Already running
 
             cmd = self._build_monitor_command(config)
-            logger.info(f"Starting monitor {recorder_id}: {' '.join(cmd)}")
+            logger.info("Starting monitor %d: %s", recorder_id, _ShellCommand(cmd))
 
             try:
                 process = await asyncio.create_subprocess_exec(
                     *cmd,
                     stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.DEVNULL
+                    stderr=asyncio.subprocess.DEVNULL,
+                    limit=STREAM_LIMIT
                 )
 
                 mon_proc = MonitorProcess(
@@ -457,16 +641,16 @@ class RecorderManager:
                 )
 
                 self._monitors[recorder_id] = mon_proc
-                logger.info(f"Monitor {recorder_id} started with PID {process.pid}")
+                logger.info("Monitor %d started with PID %s", recorder_id, process.pid)
                 return True
 
             except Exception as e:
-                logger.error(f"Failed to start monitor {recorder_id}: {e}")
+                logger.error("Failed to start monitor %d: %s", recorder_id, e)
                 return False
 
     async def stop_monitor(self, recorder_id: int) -> bool:
         """Stop level monitoring for a recorder."""
-        async with self._lock:
+        async with self._locks[recorder_id]:
             if recorder_id not in self._monitors:
                 return True
 
@@ -475,25 +659,19 @@ class RecorderManager:
                 del self._monitors[recorder_id]
                 return True
 
-            logger.debug(f"Stopping monitor {recorder_id}...")
+            logger.debug("Stopping monitor %d...", recorder_id)
 
             try:
                 if mon.stdout_task:
                     mon.stdout_task.cancel()
 
-                mon.process.send_signal(signal.SIGTERM)
-
-                try:
-                    await asyncio.wait_for(mon.process.wait(), timeout=2)
-                except asyncio.TimeoutError:
-                    mon.process.kill()
-                    await mon.process.wait()
+                await self._terminate(mon.process, timeout=2)
 
                 del self._monitors[recorder_id]
                 return True
 
             except Exception as e:
-                logger.error(f"Error stopping monitor {recorder_id}: {e}")
+                logger.error("Error stopping monitor %d: %s", recorder_id, e)
                 return False
 
     async def _read_monitor_levels(self, recorder_id: int):
@@ -505,61 +683,28 @@ class RecorderManager:
         if not mon.process or not mon.process.stdout:
             return
 
+        carry = b''
+
         try:
-            while mon.process.returncode is None:
-                try:
-                    line = await asyncio.wait_for(
-                        mon.process.stdout.readline(),
-                        timeout=1.0
-                    )
-                    if line:
-                        line_str = line.decode().strip()
-                        if line_str.startswith('{') and '"type":"levels"' in line_str:
-                            try:
-                                data = json.loads(line_str)
-                                self._update_monitor_levels(recorder_id, data)
-                            except json.JSONDecodeError:
-                                pass
-                except asyncio.TimeoutError:
-                    pass
-
-                await asyncio.sleep(0.01)
+            while True:
+                # Read in bulk so a burst of level frames costs one wakeup
+                chunk = await mon.process.stdout.read(STREAM_LIMIT)
+                if not chunk:
+                    break  # EOF, process exited
+                lines, carry = self._split_lines(carry, chunk)
+                levels = self._latest_levels(lines)
+                if levels is not None:
+                    self._update_monitor_levels(mon, levels)
 
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            logger.error(f"Monitor level reader error for recorder {recorder_id}: {e}")
-
-    def _update_monitor_levels(self, recorder_id: int, data: dict):
-        """Update stored levels for a monitor from JSON data."""
-        if recorder_id not in self._monitors:
-            return
-
-        mon = self._monitors[recorder_id]
-        channels = data.get("channels", 2)
-        levels = []
-
-        if "left" in data:
-            left = data["left"]
-            levels.append(ChannelLevel(
-                name="L",
-                level_db=left.get("rms_db", -60),
-                level_linear=10 ** (left.get("rms_db", -60) / 20),
-                peak_db=left.get("peak_db", -60),
-                clipping=left.get("clipping", False)
-            ))
-
-        if "right" in data and channels >= 2:
-            right = data["right"]
-            levels.append(ChannelLevel(
-                name="R",
-                level_db=right.get("rms_db", -60),
-                level_linear=10 ** (right.get("rms_db", -60) / 20),
-                peak_db=right.get("peak_db", -60),
-                clipping=right.get("clipping", False)
-            ))
+            logger.error("Monitor level reader error for recorder %d: %s", recorder_id, e)
 
-        mon.levels = levels
+    def _update_monitor_levels(self, mon: MonitorProcess, msg: _LevelsMsg):
+        """Update stored levels for a monitor from a level frame."""
+        self._fill_levels(mon.levels, msg)
+        mon.levels_json = self._encode_levels(mon.levels)
 
     def is_monitoring(self, recorder_id: int) -> bool:
         """Check if a recorder has active level monitoring."""
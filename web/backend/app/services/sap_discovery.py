@@ -10,14 +10,16 @@ License: GPLv2 or later
 """
 
 import asyncio
+import os
 import socket
 import struct
 import logging
 import re
-from dataclasses import dataclass, field
-from datetime import datetime
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Optional, Callable
-import ipaddress
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +29,10 @@ SAP_ADDR_ADMIN = "239.255.255.255"
 SAP_PORT = 9875
 SAP_VERSION = 1
 
+# SAP header up to and including the originating source address
+_SAP_V4_HDR = struct.Struct('>BBH4s')
+_SAP_V6_HDR = struct.Struct('>BBH16s')
+
 # SAP Timing (RFC 2974 §4, Calrec Type R compatible)
 # Professional broadcast devices announce every 30 seconds
 # Timeout at 3x interval per RFC 2974 recommendation
@@ -34,6 +40,13 @@ SAP_ANNOUNCE_INTERVAL = 30   # Expected announcement interval (seconds)
 SAP_STREAM_TIMEOUT = 90      # Mark inactive after 3x announce interval
 SAP_CLEANUP_INTERVAL = 15    # Check for expired streams (seconds)
 
+# Receive buffer for the SAP socket, sized to absorb announcement bursts
+SAP_RCVBUF_SIZE = 8 * 1024 * 1024
+
+# Linux per-socket UDP table; the last column counts datagrams the kernel
+# dropped for the socket (e.g. receive buffer full)
+PROC_NET_UDP = "/proc/net/udp"
+
 
 # SMPTE ST 2110-30 Channel Grouping Symbols (Table 1)
 SMPTE2110_CHANNEL_GROUPS = {
@@ -49,8 +62,18 @@ SMPTE2110_CHANNEL_GROUPS = {
     "SGRP": ["St1L", "St1R", "St2L", "St2R"],           # Standard Stereo Group (SDI)
 }
 
+# SDP patterns, compiled once rather than looked up per announcement.
+# Attribute patterns are bytes since SDP payloads are parsed undecoded.
+_CHANNEL_ORDER_GROUP_RE = re.compile(r'\(([^)]+)\)')
+_PTP_RE = re.compile(r'ptp=IEEE1588-\d+:([0-9A-Fa-f-]+):(\d+)')
+_DIRECT_RE = re.compile(r'direct=(\d+)')
+_RTPMAP_RE = re.compile(rb'(\d+)\s+(\w+)/(\d+)(?:/(\d+))?')
+_SOURCE_FILTER_RE = re.compile(rb'incl\s+IN\s+IP\d\s+\S+\s+(\S+)')
+_CHANNEL_ORDER_RE = re.compile(rb'channel-order=(\S+\.\(([^)]+)\))')
+_EQUALS = ord('=')
+
 
-@dataclass
+@dataclass(slots=True)
 class SDPStream:
     """Parsed SDP stream information per SMPTE ST 2110-30."""
     session_name: str = ""
@@ -68,7 +91,7 @@ class SDPStream:
     samples_per_packet: int = 48
     source_addr: Optional[str] = None  # For SSM
     is_ssm: bool = False
-    channel_labels: list[str] = field(default_factory=list)
+    channel_labels: tuple[str, ...] = ()
     channel_order_raw: str = ""  # Raw channel-order string e.g. "SMPTE2110.(51,ST)"
     mediaclk: str = ""
     mediaclk_offset: int = 0  # Should be 0 for ST 2110
@@ -77,52 +100,63 @@ class SDPStream:
     ptp_domain: int = 0  # PTP domain from ts-refclk
     is_st2110_compliant: bool = False  # True if mediaclk:direct=0
     conformance_level: str = ""  # A, B, C, AX, BX, CX
-    raw_sdp: str = ""
+    raw_sdp: bytes = b""  # Undecoded payload
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredStream:
     """A discovered stream with metadata."""
     id: str  # Hash-based ID
     sdp: SDPStream
     origin_ip: str
-    first_seen: datetime
-    last_seen: datetime
+    first_seen: datetime  # Wall clock, for display
+    last_seen: float  # time.monotonic(), immune to clock steps
     active: bool = True
 
+    @property
+    def last_seen_wall(self) -> datetime:
+        """Wall-clock time of the latest announcement, for display."""
+        return datetime.now() - timedelta(seconds=time.monotonic() - self.last_seen)
+
 
-def parse_channel_order(channel_order_str: str) -> list[str]:
+def parse_channel_order(channel_order_str: str) -> tuple[str, ...]:
     """
     Parse SMPTE2110 channel-order into channel labels.
 
     Format: SMPTE2110.(symbol1,symbol2,...)
-    Example: SMPTE2110.(51,ST) -> ['L','R','C','LFE','Ls','Rs','L','R']
-    """
-    labels = []
+    Example: SMPTE2110.(51,ST) -> ('L','R','C','LFE','Ls','Rs','L','R')
 
+    Labels are interned so streams share one string per label.
+    """
     # Extract symbols from parentheses
-    match = re.search(r'\(([^)]+)\)', channel_order_str)
+    match = _CHANNEL_ORDER_GROUP_RE.search(channel_order_str)
     if not match:
-        return labels
+        return ()
+
+    return _channel_labels(match.group(1))
 
-    symbols = match.group(1).split(',')
 
-    for symbol in symbols:
+def _channel_labels(symbols_str: str) -> tuple[str, ...]:
+    """Expand comma-separated SMPTE2110 channel-order symbols into labels."""
+    labels = []
+    groups = SMPTE2110_CHANNEL_GROUPS
+
+    for symbol in symbols_str.split(','):
         symbol = symbol.strip()
 
         # Check for undefined groups U01-U64
-        if re.match(r'^U(\d+)$', symbol):
+        if symbol.startswith('U') and symbol[1:].isdecimal():
             count = int(symbol[1:])
             for i in range(count):
-                labels.append(f"U{len(labels)+1}")
+                labels.append(sys.intern(f"U{len(labels)+1}"))
         # Check known SMPTE2110 symbols
-        elif symbol in SMPTE2110_CHANNEL_GROUPS:
-            labels.extend(SMPTE2110_CHANNEL_GROUPS[symbol])
+        elif symbol in groups:
+            labels.extend(groups[symbol])
         # Unknown symbol - add as-is
         elif symbol:
-            labels.append(symbol)
+            labels.append(sys.intern(symbol))
 
-    return labels
+    return tuple(labels)
 
 
 def parse_ts_refclk(ts_refclk: str) -> tuple[str, int]:
@@ -137,7 +171,7 @@ def parse_ts_refclk(ts_refclk: str) -> tuple[str, int]:
     grandmaster = ""
     domain = 0
 
-    match = re.search(r'ptp=IEEE1588-\d+:([0-9A-Fa-f-]+):(\d+)', ts_refclk)
+    match = _PTP_RE.search(ts_refclk)
     if match:
         grandmaster = match.group(1).upper()
         domain = int(match.group(2))
@@ -156,15 +190,11 @@ def parse_mediaclk(mediaclk: str) -> tuple[bool, int]:
     is_compliant = False
     offset = -1
 
-    if mediaclk.startswith('direct='):
-        try:
-            # Extract offset value
-            match = re.match(r'direct=(\d+)', mediaclk)
-            if match:
-                offset = int(match.group(1))
-                is_compliant = (offset == 0)
-        except ValueError:
-            pass
+    # Anchored match covers the 'direct=' prefix check as well
+    match = _DIRECT_RE.match(mediaclk)
+    if match:
+        offset = int(match.group(1))
+        is_compliant = (offset == 0)
 
     return is_compliant, offset
 
@@ -204,9 +234,129 @@ def detect_conformance_level(channels: int, ptime: float, sample_rate: int) -> s
     return ""  # Non-conformant
 
 
-def parse_sdp(sdp_text: str) -> Optional[SDPStream]:
+def _text(value: bytes) -> str:
+    """Decode an SDP field; RFC 8866 text fields are UTF-8."""
+    return value.decode('utf-8', errors='ignore')
+
+
+def _parse_rtpmap(stream: SDPStream, value: bytes):
+    """a=rtpmap:<pt> <encoding>/<clock>[/<channels>]"""
+    match = _RTPMAP_RE.match(value)
+    if match:
+        stream.payload_type = int(match.group(1))
+        stream.encoding = match.group(2).decode('ascii')
+        stream.sample_rate = int(match.group(3))
+        stream.channels = int(match.group(4)) if match.group(4) else 2
+
+
+def _parse_ptime(stream: SDPStream, value: bytes):
+    """a=ptime:<packet time in ms>"""
+    try:
+        stream.ptime = float(value)
+    except ValueError:
+        pass
+
+
+def _parse_source_filter(stream: SDPStream, value: bytes):
+    """a=source-filter: incl IN IP4 <dest> <source>"""
+    match = _SOURCE_FILTER_RE.search(value)
+    if match:
+        stream.source_addr = _text(match.group(1))
+        stream.is_ssm = True
+
+
+def _parse_mediaclk_attr(stream: SDPStream, value: bytes):
+    """a=mediaclk:direct=<offset>"""
+    stream.mediaclk = _text(value)
+    stream.is_st2110_compliant, stream.mediaclk_offset = parse_mediaclk(stream.mediaclk)
+
+
+def _parse_ts_refclk_attr(stream: SDPStream, value: bytes):
+    """a=ts-refclk:ptp=IEEE1588-2008:<gm-id>:<domain>"""
+    stream.ts_refclk = _text(value)
+    stream.ptp_grandmaster, stream.ptp_domain = parse_ts_refclk(stream.ts_refclk)
+
+
+def _parse_fmtp(stream: SDPStream, value: bytes):
+    """a=fmtp:<pt> ... channel-order=SMPTE2110.(...)"""
+    match = _CHANNEL_ORDER_RE.search(value)
+    if match:
+        # Symbols come from the same match; no second search of the raw string
+        stream.channel_order_raw = _text(match.group(1))
+        stream.channel_labels = _channel_labels(_text(match.group(2)))
+
+
+# Media-level attribute handlers for the audio section, keyed on name
+_AUDIO_ATTR_HANDLERS = {
+    b'rtpmap': _parse_rtpmap,
+    b'ptime': _parse_ptime,
+    b'source-filter': _parse_source_filter,
+    b'mediaclk': _parse_mediaclk_attr,
+    b'ts-refclk': _parse_ts_refclk_attr,
+    b'fmtp': _parse_fmtp,
+}
+
+
+# SDP line handlers take (stream, value, in_audio_media) and return True
+# when the line opens the audio media section
+def _parse_origin_line(stream: SDPStream, value: bytes, in_audio_media: bool):
+    """o=<username> <sess-id> <sess-version> <nettype> <addrtype> <addr>"""
+    parts = value.split()
+    if len(parts) >= 6:
+        stream.session_id = _text(parts[1])
+        stream.session_version = _text(parts[2])
+        stream.origin_addr = _text(parts[5])
+
+
+def _parse_session_name_line(stream: SDPStream, value: bytes, in_audio_media: bool):
+    """s=<session name>"""
+    stream.session_name = _text(value)
+
+
+def _parse_session_info_line(stream: SDPStream, value: bytes, in_audio_media: bool):
+    """i=<session information>"""
+    stream.session_info = _text(value)
+
+
+def _parse_connection_line(stream: SDPStream, value: bytes, in_audio_media: bool):
+    """c=<nettype> <addrtype> <connection-address>[/<ttl>][/<num>]"""
+    parts = value.split()
+    if len(parts) >= 3:
+        stream.multicast_addr = _text(parts[2].split(b'/')[0])
+
+
+def _parse_media_line(stream: SDPStream, value: bytes, in_audio_media: bool) -> Optional[bool]:
+    """m=audio <port> RTP/AVP <fmt>"""
+    parts = value.split()
+    if len(parts) >= 4 and parts[0] == b'audio':
+        stream.port = int(parts[1])
+        stream.payload_type = int(parts[3])
+        return True
+    return None
+
+
+def _parse_attribute_line(stream: SDPStream, value: bytes, in_audio_media: bool):
+    """a=<name>:<value>, only used within the audio media section"""
+    if in_audio_media:
+        name, _, attr_value = value.partition(b':')
+        handler = _AUDIO_ATTR_HANDLERS.get(name)
+        if handler:
+            handler(stream, attr_value)
+
+
+# Line handlers indexed by the <type> byte; None for ignored types (v=, t=, ...)
+_LINE_HANDLERS: list[Optional[Callable]] = [None] * 256
+_LINE_HANDLERS[ord('o')] = _parse_origin_line
+_LINE_HANDLERS[ord('s')] = _parse_session_name_line
+_LINE_HANDLERS[ord('i')] = _parse_session_info_line
+_LINE_HANDLERS[ord('c')] = _parse_connection_line
+_LINE_HANDLERS[ord('m')] = _parse_media_line
+_LINE_HANDLERS[ord('a')] = _parse_attribute_line
+
+
+def parse_sdp(sdp_data: bytes) -> Optional[SDPStream]:
     """
-    Parse SDP text into SDPStream structure.
+    Parse an SDP payload into SDPStream structure.
 
     Compliant with:
     - RFC 8866 (SDP: Session Description Protocol)
@@ -217,87 +367,33 @@ def parse_sdp(sdp_text: str) -> Optional[SDPStream]:
     - Accepts both CRLF and LF line endings
     - Parses mandatory fields: v=, o=, s=, c=, t=, m=
     - Parses optional fields: i=, a=
+
+    The payload is parsed as bytes; only the fields that are stored are
+    decoded to str.
     """
-    stream = SDPStream(raw_sdp=sdp_text)
+    # Only audio sessions are of interest; reject others (e.g. video) with
+    # a single C-level scan before splitting anything
+    if b'm=audio' not in sdp_data:
+        return None
+
+    stream = SDPStream(raw_sdp=sdp_data)
     in_audio_media = False
 
-    # RFC 8866: Accept both CRLF and LF line endings
-    for line in sdp_text.replace('\r\n', '\n').split('\n'):
+    # Module globals bound as locals for the per-line loop
+    line_handlers = _LINE_HANDLERS
+    equals = _EQUALS
+
+    # RFC 8866: Accept both CRLF and LF line endings; strip() drops the CR,
+    # so the payload is split once without a CRLF-normalised copy
+    for line in sdp_data.split(b'\n'):
         line = line.strip()
-        if len(line) < 2 or line[1] != '=':
+        if len(line) < 2 or line[1] != equals:
             continue
 
-        type_char = line[0]
-        value = line[2:]
-
-        if type_char == 'o':
-            # o=<username> <sess-id> <sess-version> <nettype> <addrtype> <addr>
-            parts = value.split()
-            if len(parts) >= 6:
-                stream.session_id = parts[1]
-                stream.session_version = parts[2]
-                stream.origin_addr = parts[5]
-
-        elif type_char == 's':
-            stream.session_name = value
-
-        elif type_char == 'i':
-            stream.session_info = value
-
-        elif type_char == 'c':
-            # c=<nettype> <addrtype> <connection-address>[/<ttl>][/<num>]
-            parts = value.split()
-            if len(parts) >= 3:
-                addr = parts[2].split('/')[0]
-                stream.multicast_addr = addr
-
-        elif type_char == 'm':
-            # m=audio <port> RTP/AVP <fmt>
-            parts = value.split()
-            if len(parts) >= 4 and parts[0] == 'audio':
-                in_audio_media = True
-                stream.port = int(parts[1])
-                stream.payload_type = int(parts[3])
-
-        elif type_char == 'a' and in_audio_media:
-            if value.startswith('rtpmap:'):
-                # a=rtpmap:<pt> <encoding>/<clock>[/<channels>]
-                match = re.match(r'rtpmap:(\d+)\s+(\w+)/(\d+)(?:/(\d+))?', value)
-                if match:
-                    stream.payload_type = int(match.group(1))
-                    stream.encoding = match.group(2)
-                    stream.sample_rate = int(match.group(3))
-                    stream.channels = int(match.group(4)) if match.group(4) else 2
-
-            elif value.startswith('ptime:'):
-                try:
-                    stream.ptime = float(value[6:])
-                    if stream.sample_rate > 0:
-                        stream.samples_per_packet = int(stream.sample_rate * stream.ptime / 1000)
-                except ValueError:
-                    pass
-
-            elif value.startswith('source-filter:'):
-                # a=source-filter: incl IN IP4 <dest> <source>
-                match = re.search(r'incl\s+IN\s+IP\d\s+\S+\s+(\S+)', value)
-                if match:
-                    stream.source_addr = match.group(1)
-                    stream.is_ssm = True
-
-            elif value.startswith('mediaclk:'):
-                stream.mediaclk = value[9:]
-                stream.is_st2110_compliant, stream.mediaclk_offset = parse_mediaclk(stream.mediaclk)
-
-            elif value.startswith('ts-refclk:'):
-                stream.ts_refclk = value[10:]
-                stream.ptp_grandmaster, stream.ptp_domain = parse_ts_refclk(stream.ts_refclk)
-
-            elif value.startswith('fmtp:'):
-                # Look for channel-order=SMPTE2110.(...)
-                match = re.search(r'channel-order=(\S+\.\([^)]+\))', value)
-                if match:
-                    stream.channel_order_raw = match.group(1)
-                    stream.channel_labels = parse_channel_order(stream.channel_order_raw)
+        # Indexing bytes gives the type byte as an int
+        handler = line_handlers[line[0]]
+        if handler is not None:
+            in_audio_media = handler(stream, line[2:], in_audio_media) or in_audio_media
 
     # Validate we got minimum info
     if stream.multicast_addr and stream.port > 0:
@@ -306,17 +402,22 @@ def parse_sdp(sdp_text: str) -> Optional[SDPStream]:
             stream.sample_rate = 48000
         if stream.channels == 0:
             stream.channels = 2
+
+        # Computed once rate and ptime are both known, whatever their line
+        # order; integer microseconds keep the result exact
+        ptime_us = round(stream.ptime * 1000)
+        stream.samples_per_packet = (stream.sample_rate * ptime_us) // 1_000_000
         if stream.samples_per_packet == 0:
             stream.samples_per_packet = 48
 
         # Generate default channel labels if not provided
         if not stream.channel_labels:
             if stream.channels == 1:
-                stream.channel_labels = ["M"]
+                stream.channel_labels = ("M",)
             elif stream.channels == 2:
-                stream.channel_labels = ["L", "R"]
+                stream.channel_labels = ("L", "R")
             else:
-                stream.channel_labels = [f"Ch {i+1}" for i in range(stream.channels)]
+                stream.channel_labels = tuple(sys.intern(f"Ch {i+1}") for i in range(stream.channels))
 
         # Detect conformance level
         stream.conformance_level = detect_conformance_level(
@@ -328,6 +429,19 @@ def parse_sdp(sdp_text: str) -> Optional[SDPStream]:
     return None
 
 
+class _SAPProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol feeding received SAP packets to the service."""
+
+    def __init__(self, service: "SAPDiscoveryService"):
+        self._service = service
+
+    def datagram_received(self, data: bytes, addr: tuple):
+        self._service._on_datagram(data, addr)
+
+    def error_received(self, exc: Exception):
+        logger.error(f"SAP socket read error: {exc}")
+
+
 class SAPDiscoveryService:
     """SAP discovery service that listens for stream announcements."""
 
@@ -344,10 +458,20 @@ class SAPDiscoveryService:
         self.stream_timeout = stream_timeout
 
         self._streams: dict[str, DiscoveredStream] = {}
+        # Secondary indices to stream ids; the first stream seen wins a key
+        self._by_mcast: dict[str, str] = {}
+        self._by_mcast_port: dict[tuple[str, int], str] = {}
+        self._by_name: dict[str, str] = {}
+        self._active_count = 0  # Streams with active=True, for get_stats()
         self._lock = asyncio.Lock()
         self._running = False
         self._socket: Optional[socket.socket] = None
-        self._listener_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        # Packets are handled one at a time, in arrival order, so a stream's
+        # announcements and deletion can't overtake each other
+        self._packets: Optional[asyncio.Queue] = None
+        self._packet_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
         self._callbacks: list[Callable] = []
 
@@ -357,6 +481,8 @@ class SAPDiscoveryService:
         self.announcements = 0
         self.deletions = 0
         self.sdp_parse_errors = 0
+        self.packets_dropped_kernel = 0
+        self._socket_inode: Optional[int] = None
 
     def add_callback(self, callback: Callable):
         """Add callback for stream events."""
@@ -367,12 +493,16 @@ class SAPDiscoveryService:
         if self._running:
             return
 
+        self._loop = asyncio.get_running_loop()
+
         try:
             # Create UDP socket
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
             self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            self._set_rcvbuf(SAP_RCVBUF_SIZE)
             self._socket.setblocking(False)
+            self._socket_inode = os.fstat(self._socket.fileno()).st_ino
 
             # Bind to SAP port
             self._socket.bind(('', self.port))
@@ -385,29 +515,58 @@ class SAPDiscoveryService:
             )
             self._socket.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
 
+            self._packets = asyncio.Queue()
+            self._packet_task = asyncio.create_task(self._packet_loop())
+
+            # Multicast setup stays on the raw socket; the loop's datagram
+            # transport takes over reading and delivers straight to the protocol
+            self._transport, _ = await self._loop.create_datagram_endpoint(
+                lambda: _SAPProtocol(self), sock=self._socket
+            )
+
             self._running = True
-            self._listener_task = asyncio.create_task(self._listener_loop())
             self._cleanup_task = asyncio.create_task(self._cleanup_loop())
 
             logger.info(f"SAP discovery started on {self.multicast_addr}:{self.port}")
 
         except Exception as e:
             logger.error(f"Failed to start SAP discovery: {e}")
+            if self._packet_task:
+                self._packet_task.cancel()
+                self._packet_task = None
             if self._socket:
                 self._socket.close()
                 self._socket = None
             raise
 
+    def _set_rcvbuf(self, size: int):
+        """Enlarge the socket receive buffer, past rmem_max when permitted."""
+        try:
+            # Needs CAP_NET_ADMIN but ignores the net.core.rmem_max cap
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUFFORCE, size)
+        except (AttributeError, OSError):
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+
+        actual = self._socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        logger.debug(f"SAP socket receive buffer: {actual} bytes")
+
     async def stop(self):
         """Stop the SAP discovery service."""
         self._running = False
 
-        if self._listener_task:
-            self._listener_task.cancel()
+        if self._transport:
+            # Closes the socket as well
+            self._transport.close()
+            self._transport = None
+            self._socket = None
+
+        if self._packet_task:
+            self._packet_task.cancel()
             try:
-                await self._listener_task
+                await self._packet_task
             except asyncio.CancelledError:
                 pass
+            self._packet_task = None
 
         if self._cleanup_task:
             self._cleanup_task.cancel()
@@ -422,46 +581,28 @@ class SAPDiscoveryService:
 
         logger.info("SAP discovery stopped")
 
-    async def _listener_loop(self):
-        """Main listener loop using add_reader for reliable multicast."""
-        loop = asyncio.get_running_loop()
-        data_queue = asyncio.Queue()
+    def _on_datagram(self, data: bytes, addr: tuple):
+        """Transport callback (on the loop thread): queue a packet for handling."""
+        self.packets_received += 1
+        self._packets.put_nowait((data, addr[0]))
 
-        def on_readable():
+    async def _packet_loop(self):
+        """Handle queued packets in order, logging rather than raising errors."""
+        while True:
+            data, origin_ip = await self._packets.get()
             try:
-                data, addr = self._socket.recvfrom(65535)
-                loop.call_soon_threadsafe(data_queue.put_nowait, (data, addr))
-            except BlockingIOError:
-                pass
+                await self._handle_packet(data, origin_ip)
             except Exception as e:
-                logger.error(f"SAP socket read error: {e}")
-
-        loop.add_reader(self._socket.fileno(), on_readable)
-        logger.info("SAP listener loop started")
-
-        try:
-            while self._running:
-                try:
-                    data, addr = await asyncio.wait_for(data_queue.get(), timeout=1.0)
-                    self.packets_received += 1
-                    await self._handle_packet(data, addr[0])
-                except asyncio.TimeoutError:
-                    continue
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    logger.error(f"SAP listener error: {e}")
-        finally:
-            loop.remove_reader(self._socket.fileno())
+                logger.error(f"SAP listener error: {e}")
 
     async def _handle_packet(self, data: bytes, origin_ip: str):
         """Handle a SAP packet."""
-        if len(data) < 8:
+        if len(data) < _SAP_V4_HDR.size:
             self.packets_invalid += 1
             return
 
-        # Parse SAP header
-        b0 = data[0]
+        # Parse SAP header: flags, auth length, msg id hash, origin
+        b0, auth_len, msg_id_hash, origin_bytes = _SAP_V4_HDR.unpack_from(data)
         version = (b0 >> 5) & 0x07
         is_ipv6 = bool((b0 >> 4) & 0x01)
         is_deletion = bool((b0 >> 2) & 0x01)
@@ -477,22 +618,20 @@ class SAPDiscoveryService:
             self.packets_invalid += 1
             return
 
-        auth_len = data[1]
-        msg_id_hash = struct.unpack('>H', data[2:4])[0]
-
         # Origin IP (4 bytes for IPv4, 16 for IPv6)
-        origin_offset = 4
+        origin_offset = _SAP_V4_HDR.size
         if is_ipv6:
-            origin_bytes = data[4:20]
-            origin_offset = 20
-        else:
-            origin_bytes = data[4:8]
-            origin_offset = 8
+            if len(data) < _SAP_V6_HDR.size:
+                self.packets_invalid += 1
+                return
+            origin_bytes = _SAP_V6_HDR.unpack_from(data)[3]
+            origin_offset = _SAP_V6_HDR.size
 
-        try:
-            sap_origin = str(ipaddress.ip_address(origin_bytes))
-        except ValueError:
-            sap_origin = origin_ip
+        # C-level conversion; the length is fixed by the header Struct
+        if is_ipv6:
+            sap_origin = socket.inet_ntop(socket.AF_INET6, origin_bytes)
+        else:
+            sap_origin = socket.inet_ntoa(origin_bytes)
 
         # Skip auth data
         payload_offset = origin_offset + (auth_len * 4)
@@ -500,129 +639,180 @@ class SAPDiscoveryService:
             self.packets_invalid += 1
             return
 
-        # Find payload type (optional MIME type)
+        # Skip the optional null-terminated MIME type; one slice either way
+        null_pos = data.find(b'\x00', payload_offset, payload_offset + 64)
+        if null_pos != -1:
+            payload_offset = null_pos + 1
         payload_data = data[payload_offset:]
 
-        # Check for MIME type header (null-terminated)
-        if b'\x00' in payload_data[:64]:
-            null_pos = payload_data.index(b'\x00')
-            payload_data = payload_data[null_pos + 1:]
-
-        # Try to decode as SDP
-        try:
-            sdp_text = payload_data.decode('utf-8', errors='ignore')
-        except Exception:
-            self.packets_invalid += 1
-            return
-
         # Generate stream ID from origin + msg_id_hash
         stream_id = f"{sap_origin}:{msg_id_hash:04x}"
 
         if is_deletion:
             await self._handle_deletion(stream_id)
         else:
-            await self._handle_announcement(stream_id, sdp_text, sap_origin)
+            await self._handle_announcement(stream_id, payload_data, sap_origin)
 
-    async def _handle_announcement(self, stream_id: str, sdp_text: str, origin_ip: str):
+    async def _handle_announcement(self, stream_id: str, sdp_data: bytes, origin_ip: str):
         """Handle a stream announcement."""
-        sdp = parse_sdp(sdp_text)
+        # Announcers repeat the same SDP every interval; an unchanged payload
+        # just refreshes the stream without being parsed again
+        async with self._lock:
+            existing = self._streams.get(stream_id)
+            if existing is not None and existing.sdp.raw_sdp == sdp_data:
+                existing.last_seen = time.monotonic()
+                self._set_active(existing, True)
+                return
+
+        # Parse in the default executor so the socket keeps draining; payloads
+        # without an audio section are rejected here without the thread hop
+        sdp = None
+        if b'm=audio' in sdp_data:
+            sdp = await self._loop.run_in_executor(None, parse_sdp, sdp_data)
         if not sdp:
             self.sdp_parse_errors += 1
             return
 
-        now = datetime.now()
+        now = time.monotonic()
+        new_stream = None
         async with self._lock:
             if stream_id in self._streams:
                 # Update existing
-                self._streams[stream_id].sdp = sdp
-                self._streams[stream_id].last_seen = now
-                self._streams[stream_id].active = True
+                existing = self._streams[stream_id]
+                old = existing.sdp
+                existing.sdp = sdp
+                existing.last_seen = now
+                self._set_active(existing, True)
+                # Indexed fields changed (rare): re-derive which stream owns each key
+                old_keys = (old.multicast_addr, old.port, old.session_name)
+                if old_keys != (sdp.multicast_addr, sdp.port, sdp.session_name):
+                    self._rebuild_indices()
             else:
                 # New stream
-                self._streams[stream_id] = DiscoveredStream(
+                new_stream = DiscoveredStream(
                     id=stream_id,
                     sdp=sdp,
                     origin_ip=origin_ip,
-                    first_seen=now,
+                    first_seen=datetime.now(),
                     last_seen=now
                 )
+                self._streams[stream_id] = new_stream
+                self._index_stream(new_stream)
+                self._active_count += 1
                 self.announcements += 1
                 logger.info(f"Discovered stream: {sdp.session_name} ({sdp.multicast_addr}:{sdp.port})")
 
-                # Notify callbacks
-                for cb in self._callbacks:
-                    try:
-                        await cb('new', self._streams[stream_id])
-                    except Exception as e:
-                        logger.error(f"Callback error: {e}")
+        if new_stream:
+            await self._notify('new', new_stream)
 
     async def _handle_deletion(self, stream_id: str):
         """Handle a stream deletion."""
         async with self._lock:
-            if stream_id in self._streams:
-                stream = self._streams[stream_id]
-                stream.active = False
-                self.deletions += 1
-                logger.info(f"Stream deleted: {stream.sdp.session_name}")
-
-                for cb in self._callbacks:
-                    try:
-                        await cb('delete', stream)
-                    except Exception as e:
-                        logger.error(f"Callback error: {e}")
+            stream = self._streams.get(stream_id)
+            if stream is None:
+                return
+            self._set_active(stream, False)
+            self.deletions += 1
+            logger.info(f"Stream deleted: {stream.sdp.session_name}")
+
+        await self._notify('delete', stream)
+
+    async def _notify(self, event: str, stream: DiscoveredStream):
+        """Run stream event callbacks; called without the lock held."""
+        for cb in self._callbacks:
+            try:
+                await cb(event, stream)
+            except Exception as e:
+                logger.error(f"Callback error: {e}")
+
+    def _set_active(self, stream: DiscoveredStream, active: bool):
+        """Set a stream's active flag, keeping the active count in step."""
+        if stream.active != active:
+            stream.active = active
+            self._active_count += 1 if active else -1
+
+    def _index_stream(self, stream: DiscoveredStream):
+        """Add a stream to the lookup indices unless an earlier one holds the key."""
+        sdp = stream.sdp
+        self._by_mcast.setdefault(sdp.multicast_addr, stream.id)
+        self._by_mcast_port.setdefault((sdp.multicast_addr, sdp.port), stream.id)
+        self._by_name.setdefault(sdp.session_name, stream.id)
+
+    def _rebuild_indices(self):
+        """Rebuild the lookup indices, in discovery order."""
+        self._by_mcast.clear()
+        self._by_mcast_port.clear()
+        self._by_name.clear()
+        for stream in self._streams.values():
+            self._index_stream(stream)
 
     async def _cleanup_loop(self):
         """Periodically clean up expired streams."""
         while self._running:
             await asyncio.sleep(SAP_CLEANUP_INTERVAL)
 
-            now = datetime.now()
-            expired = []
-
-            async with self._lock:
-                for stream_id, stream in self._streams.items():
-                    age = (now - stream.last_seen).total_seconds()
-                    if age > self.stream_timeout:
-                        expired.append(stream_id)
+            # The sweep never awaits, so it runs to completion between
+            # packets without taking the lock; no handler can interleave
+            self._update_kernel_drops()
 
-                for stream_id in expired:
-                    stream = self._streams[stream_id]
-                    stream.active = False
+            now = time.monotonic()
+            timeout = self.stream_timeout
+            for stream in self._streams.values():
+                if stream.active and now - stream.last_seen > timeout:
+                    self._set_active(stream, False)
                     logger.info(f"Stream expired: {stream.sdp.session_name}")
 
+    # Readers don't await, so they can't observe a half-applied update and
+    # need no lock; they stay async for existing callers.
+
     async def get_streams(self, active_only: bool = True) -> list[DiscoveredStream]:
         """Get list of discovered streams."""
-        async with self._lock:
-            if active_only:
-                return [s for s in self._streams.values() if s.active]
-            return list(self._streams.values())
+        if active_only:
+            return [s for s in self._streams.values() if s.active]
+        return list(self._streams.values())
 
     async def find_stream(self, multicast_addr: str, port: int = 0) -> Optional[DiscoveredStream]:
         """Find a stream by multicast address."""
-        async with self._lock:
-            for stream in self._streams.values():
-                if stream.sdp.multicast_addr == multicast_addr:
-                    if port == 0 or stream.sdp.port == port:
-                        return stream
-        return None
+        if port == 0:
+            stream_id = self._by_mcast.get(multicast_addr)
+        else:
+            stream_id = self._by_mcast_port.get((multicast_addr, port))
+        return self._streams.get(stream_id) if stream_id else None
 
     async def find_by_name(self, name: str) -> Optional[DiscoveredStream]:
         """Find a stream by session name."""
-        async with self._lock:
-            for stream in self._streams.values():
-                if stream.sdp.session_name == name:
-                    return stream
-        return None
+        stream_id = self._by_name.get(name)
+        return self._streams.get(stream_id) if stream_id else None
+
+    def _update_kernel_drops(self):
+        """Refresh packets_dropped_kernel from the kernel's UDP socket table."""
+        if self._socket_inode is None:
+            return
+        inode = str(self._socket_inode)
+        try:
+            with open(PROC_NET_UDP) as f:
+                next(f)  # Header
+                for line in f:
+                    fields = line.split()
+                    # ... uid timeout inode ref pointer drops
+                    if len(fields) >= 13 and fields[9] == inode:
+                        self.packets_dropped_kernel = int(fields[12])
+                        return
+        except (OSError, ValueError, StopIteration) as e:
+            # Not Linux, or no procfs
+            logger.debug(f"Cannot read SAP socket drops: {e}")
+            self._socket_inode = None
 
     def get_stats(self) -> dict:
         """Get discovery statistics."""
         return {
             "packets_received": self.packets_received,
             "packets_invalid": self.packets_invalid,
+            "packets_dropped_kernel": self.packets_dropped_kernel,
             "announcements": self.announcements,
             "deletions": self.deletions,
             "sdp_parse_errors": self.sdp_parse_errors,
-            "active_streams": len([s for s in self._streams.values() if s.active])
+            "active_streams": self._active_count
         }
 
     @property
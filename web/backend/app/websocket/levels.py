@@ -14,6 +14,7 @@ import json
 import logging
 
 from ..api.recorders import get_all_recorders, update_recorder_levels
+from ..json_codec import json_loads, json_dumps
 from ..models import ChannelLevel, RecorderState
 from ..services.recorder_manager import get_recorder_manager
 
@@ -21,38 +22,142 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Levels for a recorder without level data. Shared by every idle recorder
+# on every frame, so never mutated; the JSON is encoded once.
+_SILENCE_LEVELS = [
+    ChannelLevel(name="L", level_db=-60, level_linear=0, peak_db=-60, clipping=False),
+    ChannelLevel(name="R", level_db=-60, level_linear=0, peak_db=-60, clipping=False)
+]
+_SILENCE_CHANNELS_JSON = json_dumps([l.model_dump() for l in _SILENCE_LEVELS])
+
+# While levels are unchanged, send this instead of repeating the frame
+_HEARTBEAT_JSON = b'{"type":"heartbeat"}'
+HEARTBEAT_INTERVAL = 1.0  # seconds
+
+FRAME_INTERVAL = 1 / 30  # ~30 fps
+
+# recorder_id -> (identity fields, encoded entry head up to "channels":)
+_entry_heads: dict[int, tuple[tuple, bytes]] = {}
+
+
+def _recorder_entry_json(recorder, channels_json: bytes) -> bytes:
+    """Encode one recorder's all_levels entry around pre-encoded channels."""
+    # Only the channels change from frame to frame; the rest of the entry
+    # is re-encoded when the recorder is renamed, moved or changes state
+    key = (recorder.name, recorder.studio_id, recorder.state)
+    cached = _entry_heads.get(recorder.id)
+    if cached is None or cached[0] != key:
+        head = json_dumps({
+            "recorder_id": recorder.id,
+            "recorder_name": recorder.name,
+            "studio_id": recorder.studio_id,
+            "state": recorder.state.value
+        })
+        # Splice the channels in before the closing brace
+        cached = (key, head[:-1] + b',"channels":')
+        _entry_heads[recorder.id] = cached
+    return cached[1] + channels_json + b'}'
+
+
+# recorder_id -> (state, levels list, encoded single-recorder frame)
+_recorder_frames: dict[int, tuple] = {}
+
+
+def _recorder_frame_json(recorder) -> bytes:
+    """Encode a recorder's /ws/levels/{id} frame, reused while unchanged."""
+    # Levels are replaced, never mutated, so identity means unchanged; one
+    # encoding serves every tick and every socket watching the recorder
+    cached = _recorder_frames.get(recorder.id)
+    if cached is not None and cached[0] is recorder.state and cached[1] is recorder.levels:
+        return cached[2]
+
+    frame = json_dumps({
+        "type": "levels",
+        "recorder_id": recorder.id,
+        "state": recorder.state.value,
+        "channels": [l.model_dump() for l in recorder.levels]
+    })
+    _recorder_frames[recorder.id] = (recorder.state, recorder.levels, frame)
+    return frame
+
 
 class ConnectionManager:
     """Manage WebSocket connections for audio level streaming."""
 
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
         self._level_task: Optional[asyncio.Task] = None
         self._running = False
+        # Recorder entries of the last all_levels frame sent, and when
+        # anything (frame or heartbeat) was last sent
+        self._last_recorders_json: Optional[bytes] = None
+        self._last_send_time = 0.0
+        # recorder_id -> channels JSON last stored on the recorder
+        self._stored_channels: dict[int, bytes] = {}
+        # Per-client pending frame (at most one) and the task writing it
+        self._outboxes: dict[WebSocket, asyncio.Queue] = {}
+        self._writers: dict[WebSocket, asyncio.Task] = {}
+        # Single-recorder clients, both ways round
+        self._subscribers: dict[int, set[WebSocket]] = {}
+        self._subscriptions: dict[WebSocket, int] = {}
+        # recorder_id -> (frame last sent to its subscribers, when sent)
+        self._recorder_sent: dict[int, tuple[bytes, float]] = {}
 
     async def connect(self, websocket: WebSocket):
         """Accept and register a new WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self._add_client(websocket)
+        self.active_connections.add(websocket)
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
-        # Start level broadcasting if not already running
-        if not self._running:
-            self._running = True
-            self._level_task = asyncio.create_task(self._broadcast_levels())
+        # New client needs a full frame even if nothing has changed
+        self._last_recorders_json = None
+        self._start_broadcasting()
+
+    async def subscribe(self, websocket: WebSocket, recorder_id: int):
+        """Accept a WebSocket that only wants one recorder's levels."""
+        await websocket.accept()
+        self._add_client(websocket)
+        self._subscribers.setdefault(recorder_id, set()).add(websocket)
+        self._subscriptions[websocket] = recorder_id
+
+        # New subscriber needs a full frame even if nothing has changed
+        self._recorder_sent.pop(recorder_id, None)
+        self._start_broadcasting()
 
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        recorder_id = self._subscriptions.pop(websocket, None)
+        if recorder_id is not None:
+            subscribers = self._subscribers[recorder_id]
+            subscribers.discard(websocket)
+            if not subscribers:
+                del self._subscribers[recorder_id]
+        self._outboxes.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer:
+            writer.cancel()
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
         # Stop broadcasting if no connections
-        if not self.active_connections:
+        if not self._outboxes:
             self._running = False
             if self._level_task:
                 self._level_task.cancel()
 
+    def _add_client(self, websocket: WebSocket):
+        """Give an accepted client its outbox and writer task."""
+        queue = asyncio.Queue(maxsize=1)
+        self._outboxes[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer_loop(websocket, queue))
+
+    def _start_broadcasting(self):
+        """Start level broadcasting if not already running."""
+        if not self._running:
+            self._running = True
+            self._level_task = asyncio.create_task(self._broadcast_levels())
+
     async def _ensure_monitors_running(self):
         """Start monitors for all recorders that aren't currently recording."""
         manager = get_recorder_manager()
@@ -64,83 +169,116 @@ class ConnectionManager:
                     logger.info(f"Starting level monitor for recorder {recorder.id}")
                     await manager.start_monitor(recorder.id, recorder.config)
 
-    async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients in parallel."""
-        if not self.active_connections:
+    def broadcast(self, payload: bytes):
+        """Queue an encoded JSON message for every all-levels client."""
+        for websocket in self.active_connections:
+            self._enqueue(self._outboxes[websocket], payload)
+
+    @staticmethod
+    def _enqueue(queue: asyncio.Queue, payload: bytes):
+        """Queue a frame for one client, replacing any it hasn't sent yet."""
+        if queue.full():
+            # Client is behind. Each level frame is complete, so only the
+            # newest matters; stale ones are dropped, not replayed. A
+            # pending level frame also does a heartbeat's job.
+            pending = queue.get_nowait()
+            if payload is _HEARTBEAT_JSON:
+                payload = pending
+        queue.put_nowait(payload)
+
+    def _send_to_subscribers(self, recorder, now: float):
+        """Queue a recorder's frame for its subscribers when it has changed."""
+        frame = _recorder_frame_json(recorder)
+        sent = self._recorder_sent.get(recorder.id)
+        if sent is None or sent[0] is not frame:
+            payload = frame
+        elif now - sent[1] >= HEARTBEAT_INTERVAL:
+            payload = _HEARTBEAT_JSON
+        else:
             return
-
-        data = json.dumps(message)
-
-        async def send_to_client(connection: WebSocket):
-            try:
-                await connection.send_text(data)
-                return None
-            except Exception:
-                return connection
-
-        # Send to all clients in parallel
-        results = await asyncio.gather(
-            *[send_to_client(conn) for conn in self.active_connections],
-            return_exceptions=True
-        )
-
-        # Clean up disconnected clients
-        for result in results:
-            if result is not None and isinstance(result, WebSocket):
-                self.disconnect(result)
+        self._recorder_sent[recorder.id] = (frame, now)
+        for websocket in self._subscribers[recorder.id]:
+            self._enqueue(self._outboxes[websocket], payload)
+
+    async def _writer_loop(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Send queued frames to one client, so a slow client only delays itself."""
+        try:
+            while True:
+                payload = await queue.get()
+                # Binary frame: the payload is already UTF-8 bytes, so it
+                # isn't re-encoded for every client
+                await websocket.send_bytes(payload)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            self.disconnect(websocket)
 
     async def _broadcast_levels(self):
         """Continuously broadcast audio levels for all recorders."""
         manager = get_recorder_manager()
+        loop = asyncio.get_running_loop()
 
         # Start monitors for all recorders that aren't recording
         await self._ensure_monitors_running()
 
+        # Fixed-rate schedule: frame time doesn't add to the interval
+        next_deadline = loop.time()
+
         while self._running:
             try:
                 recorders = get_all_recorders()
-                recorder_levels = []
+                entries = []
+                now = loop.time()
 
                 for recorder in recorders:
+                    channels_json = None
                     if recorder.state == RecorderState.RECORDING:
-                        # Get real levels from recorder manager
-                        real_levels = manager.get_levels(recorder.id)
-
-                        if real_levels:
-                            # Use real levels from audyn process
-                            levels = real_levels
+                        # Real levels from the audyn process, already encoded
+                        # by the recorder manager when they were updated
+                        channels_json = manager.get_levels_json(recorder.id)
+
+                    if channels_json is None:
+                        # Silence when not recording or no real levels (no fake data)
+                        channels_json = _SILENCE_CHANNELS_JSON
+
+                    # Update recorder's levels, only when they've changed: the
+                    # manager encodes a new bytes object per level update
+                    if channels_json is not self._stored_channels.get(recorder.id):
+                        self._stored_channels[recorder.id] = channels_json
+                        if channels_json is _SILENCE_CHANNELS_JSON:
+                            levels = _SILENCE_LEVELS
                         else:
-                            # No real levels available - show silence (no fake data)
-                            levels = [
-                                ChannelLevel(name="L", level_db=-60, level_linear=0, peak_db=-60, clipping=False),
-                                ChannelLevel(name="R", level_db=-60, level_linear=0, peak_db=-60, clipping=False)
-                            ]
-                    else:
-                        # Silence when not recording
-                        levels = [
-                            ChannelLevel(name="L", level_db=-60, level_linear=0, peak_db=-60, clipping=False),
-                            ChannelLevel(name="R", level_db=-60, level_linear=0, peak_db=-60, clipping=False)
-                        ]
-
-                    # Update recorder's levels
-                    update_recorder_levels(recorder.id, levels)
-
-                    recorder_levels.append({
-                        "recorder_id": recorder.id,
-                        "recorder_name": recorder.name,
-                        "studio_id": recorder.studio_id,
-                        "state": recorder.state.value,
-                        "channels": [l.model_dump() for l in levels]
-                    })
-
-                await self.broadcast({
-                    "type": "all_levels",
-                    "timestamp": asyncio.get_event_loop().time(),
-                    "recorders": recorder_levels
-                })
-
-                # Update at ~30 fps
-                await asyncio.sleep(1 / 30)
+                            levels = manager.get_levels(recorder.id)
+                        update_recorder_levels(recorder.id, levels)
+
+                    entries.append(_recorder_entry_json(recorder, channels_json))
+
+                    if recorder.id in self._subscribers:
+                        self._send_to_subscribers(recorder, now)
+
+                recorders_json = b','.join(entries)
+
+                if recorders_json != self._last_recorders_json:
+                    # Channel lists are spliced in as bytes; nothing is re-serialized
+                    self._last_recorders_json = recorders_json
+                    self._last_send_time = now
+                    self.broadcast(
+                        b'{"type":"all_levels","timestamp":%s,"recorders":[%s]}' % (
+                            repr(now).encode(), recorders_json
+                        )
+                    )
+                elif now - self._last_send_time >= HEARTBEAT_INTERVAL:
+                    # Nothing changed (e.g. all idle): clients keep the last frame
+                    self._last_send_time = now
+                    self.broadcast(_HEARTBEAT_JSON)
+
+                next_deadline += FRAME_INTERVAL
+                delay = next_deadline - loop.time()
+                if delay < -FRAME_INTERVAL:
+                    # More than a frame behind: resync rather than burst
+                    next_deadline = loop.time()
+                    delay = 0
+                await asyncio.sleep(max(0, delay))
 
             except asyncio.CancelledError:
                 break
@@ -157,7 +295,10 @@ async def websocket_all_levels(websocket: WebSocket):
     """
     WebSocket endpoint for real-time audio levels of all recorders.
 
-    Sends JSON messages with audio level data for all recorders:
+    Sends JSON messages with audio level data for all recorders as binary
+    (UTF-8) frames; pong and keepalive replies are text frames. Frames are
+    only sent when levels change, with a {"type": "heartbeat"} frame every
+    second while they don't:
     {
         "type": "all_levels",
         "timestamp": 1234567890.123,
@@ -182,7 +323,7 @@ async def websocket_all_levels(websocket: WebSocket):
         while True:
             try:
                 data = await asyncio.wait_for(websocket.receive_text(), timeout=30)
-                message = json.loads(data)
+                message = json_loads(data)
                 if message.get("type") == "ping":
                     await websocket.send_text(json.dumps({"type": "pong"}))
             except asyncio.TimeoutError:
@@ -199,25 +340,22 @@ async def websocket_all_levels(websocket: WebSocket):
 async def websocket_recorder_levels(websocket: WebSocket, recorder_id: int):
     """
     WebSocket endpoint for a single recorder's audio levels.
+
+    Sends {"type": "levels", ...} JSON messages as binary (UTF-8) frames,
+    from the shared level broadcaster: only when the recorder's levels or
+    state change, with a {"type": "heartbeat"} frame every second while
+    they don't.
     """
-    await websocket.accept()
+    await manager.subscribe(websocket, recorder_id)
 
     try:
+        # Nothing is expected from the client; reading detects the disconnect
         while True:
-            recorders = get_all_recorders()
-            recorder = next((r for r in recorders if r.id == recorder_id), None)
-
-            if recorder:
-                await websocket.send_text(json.dumps({
-                    "type": "levels",
-                    "recorder_id": recorder_id,
-                    "state": recorder.state.value,
-                    "channels": [l.model_dump() for l in recorder.levels]
-                }))
-
-            await asyncio.sleep(1 / 30)
+            await websocket.receive_text()
 
     except WebSocketDisconnect:
         pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
+    finally:
+        manager.disconnect(websocket)
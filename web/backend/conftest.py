@@ -0,0 +1,13 @@
+"""
+Pytest configuration for the Audyn backend.
+
+Having a conftest.py at the backend root puts this directory on sys.path,
+so tests import the application as the ``app`` package.
+"""
+
+import os
+import tempfile
+
+# Some API modules load (and save default) configs at import; keep that
+# out of the user's ~/.config/audyn
+os.environ.setdefault("AUDYN_CONFIG_DIR", tempfile.mkdtemp(prefix="audyn-test-config-"))
@@ -0,0 +1,109 @@
+"""
+Tests for the per-client outboxes of the levels WebSocket manager.
+"""
+
+import asyncio
+
+from app.websocket.levels import ConnectionManager, _HEARTBEAT_JSON
+
+
+class FakeWebSocket:
+    """Records sent frames; send_bytes blocks while the client is stalled."""
+
+    def __init__(self):
+        self.sent: list[bytes] = []
+        self.ready = asyncio.Event()
+        self.ready.set()
+
+    async def accept(self):
+        pass
+
+    async def send_bytes(self, payload: bytes):
+        await self.ready.wait()
+        self.sent.append(payload)
+
+
+def _manager(monkeypatch) -> ConnectionManager:
+    """A manager whose level broadcast loop is never started."""
+    manager = ConnectionManager()
+    monkeypatch.setattr(manager, "_start_broadcasting", lambda: None)
+    return manager
+
+
+def test_heartbeat_does_not_replace_pending_frame():
+    async def run():
+        queue = asyncio.Queue(maxsize=1)
+        ConnectionManager._enqueue(queue, b"frame-1")
+        ConnectionManager._enqueue(queue, _HEARTBEAT_JSON)
+        return queue.get_nowait()
+
+    assert asyncio.run(run()) == b"frame-1"
+
+
+def test_newer_frame_replaces_pending_frame():
+    async def run():
+        queue = asyncio.Queue(maxsize=1)
+        ConnectionManager._enqueue(queue, _HEARTBEAT_JSON)
+        ConnectionManager._enqueue(queue, b"frame-1")
+        ConnectionManager._enqueue(queue, b"frame-2")
+        return queue.qsize(), queue.get_nowait()
+
+    assert asyncio.run(run()) == (1, b"frame-2")
+
+
+def test_slow_client_keeps_newest_frame(monkeypatch):
+    async def run():
+        manager = _manager(monkeypatch)
+        slow, fast = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+        slow.ready.clear()
+
+        # The slow client's writer takes frame-0 and stalls sending it
+        manager.broadcast(b"frame-0")
+        await asyncio.sleep(0)
+        for i in range(1, 5):
+            manager.broadcast(b"frame-%d" % i)
+            await asyncio.sleep(0)
+
+        slow.ready.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        manager.disconnect(slow)
+        manager.disconnect(fast)
+        return slow.sent, fast.sent
+
+    slow_sent, fast_sent = asyncio.run(run())
+    assert slow_sent == [b"frame-0", b"frame-4"]
+    assert fast_sent == [b"frame-%d" % i for i in range(5)]
+
+
+def test_subscribe_and_disconnect_clean_up(monkeypatch):
+    async def run():
+        manager = _manager(monkeypatch)
+        first, second = FakeWebSocket(), FakeWebSocket()
+        await manager.subscribe(first, 3)
+        await manager.subscribe(second, 3)
+
+        assert manager._subscribers == {3: {first, second}}
+        assert manager._subscriptions == {first: 3, second: 3}
+        assert set(manager._outboxes) == {first, second}
+        writer = manager._writers[first]
+
+        manager.disconnect(first)
+        assert manager._subscribers == {3: {second}}
+        assert first not in manager._outboxes
+        assert first not in manager._writers
+        await asyncio.sleep(0)
+        assert writer.cancelled() or writer.done()
+
+        manager.disconnect(second)
+        assert manager._subscribers == {}
+        assert manager._subscriptions == {}
+        assert manager._outboxes == {}
+        assert manager._writers == {}
+        assert manager.active_connections == set()
+        assert manager._running is False
+
+    asyncio.run(run())
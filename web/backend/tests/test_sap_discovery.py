@@ -0,0 +1,139 @@
+"""
+Tests for SDP parsing in the SAP discovery service.
+"""
+
+from app.services.sap_discovery import parse_sdp
+
+
+# Dante/AES67 stereo announcement, CRLF line endings
+AES67_STEREO_SDP = (
+    b"v=0\r\n"
+    b"o=- 1423986 1423994 IN IP4 169.254.98.63\r\n"
+    b"s=AOIP44-serial-1614 : 2\r\n"
+    b"i=2 channels: Left, Right\r\n"
+    b"c=IN IP4 239.65.125.63/32\r\n"
+    b"t=0 0\r\n"
+    b"a=keywds:Dante\r\n"
+    b"m=audio 5004 RTP/AVP 97\r\n"
+    b"a=recvonly\r\n"
+    b"a=rtpmap:97 L24/48000/2\r\n"
+    b"a=ptime:1\r\n"
+    b"a=ts-refclk:ptp=IEEE1588-2008:00-1D-C1-FF-FE-0E-10-C4:0\r\n"
+    b"a=mediaclk:direct=0\r\n"
+)
+
+# ST 2110-30 source-specific multicast with an explicit channel order
+ST2110_SURROUND_SDP = (
+    b"v=0\n"
+    b"o=- 1 2 IN IP4 10.0.0.1\n"
+    b"s=Calrec 5.1\n"
+    b"c=IN IP4 239.1.1.1/64\n"
+    b"t=0 0\n"
+    b"m=audio 5004 RTP/AVP 96\n"
+    b"a=ptime:0.125\n"
+    b"a=rtpmap:96 L24/96000/8\n"
+    b"a=fmtp:96 channel-order=SMPTE2110.(51,ST)\n"
+    b"a=source-filter: incl IN IP4 239.1.1.1 10.0.0.9\n"
+    b"a=mediaclk:direct=12\n"
+    b"a=ts-refclk:ptp=IEEE1588-2008:ab-cd-ef-ff-fe-00-11-22:127\n"
+)
+
+
+def _audio_sdp(rtpmap: bytes, ptime: bytes = b"") -> bytes:
+    """Build a minimal audio SDP with the given rtpmap and optional ptime."""
+    sdp = (
+        b"v=0\n"
+        b"o=- 1 2 IN IP4 10.0.0.1\n"
+        b"s=test\n"
+        b"c=IN IP4 239.1.1.4\n"
+        b"t=0 0\n"
+        b"m=audio 7000 RTP/AVP 100\n"
+        b"a=rtpmap:100 " + rtpmap + b"\n"
+    )
+    if ptime:
+        sdp += b"a=ptime:" + ptime + b"\n"
+    return sdp
+
+
+def test_parse_aes67_stereo():
+    stream = parse_sdp(AES67_STEREO_SDP)
+
+    assert stream is not None
+    assert stream.session_name == "AOIP44-serial-1614 : 2"
+    assert stream.session_info == "2 channels: Left, Right"
+    assert stream.origin_addr == "169.254.98.63"
+    assert stream.multicast_addr == "239.65.125.63"
+    assert stream.port == 5004
+    assert stream.payload_type == 97
+    assert stream.encoding == "L24"
+    assert stream.sample_rate == 48000
+    assert stream.channels == 2
+    assert stream.channel_labels == ("L", "R")
+    assert stream.ptime == 1.0
+    assert stream.samples_per_packet == 48
+    assert stream.is_ssm is False
+    assert stream.ptp_grandmaster == "00-1D-C1-FF-FE-0E-10-C4"
+    assert stream.ptp_domain == 0
+    assert stream.is_st2110_compliant is True
+    assert stream.raw_sdp == AES67_STEREO_SDP
+
+
+def test_parse_st2110_channel_order_and_ssm():
+    stream = parse_sdp(ST2110_SURROUND_SDP)
+
+    assert stream is not None
+    assert stream.channels == 8
+    assert stream.channel_order_raw == "SMPTE2110.(51,ST)"
+    assert stream.channel_labels == ("L", "R", "C", "LFE", "Ls", "Rs", "L", "R")
+    assert stream.is_ssm is True
+    assert stream.source_addr == "10.0.0.9"
+    assert stream.mediaclk_offset == 12
+    assert stream.is_st2110_compliant is False
+    assert stream.ptp_domain == 127
+
+
+def test_samples_per_packet_from_ptime():
+    # 125 us at 96 kHz
+    assert parse_sdp(ST2110_SURROUND_SDP).samples_per_packet == 12
+    # 4 ms at 48 kHz
+    assert parse_sdp(_audio_sdp(b"L16/48000/2", b"4")).samples_per_packet == 192
+    # ptime before rtpmap still uses the announced sample rate
+    late = _audio_sdp(b"L24/96000/4").replace(b"a=rtpmap", b"a=ptime:1\na=rtpmap")
+    assert parse_sdp(late).samples_per_packet == 96
+
+
+def test_invalid_ptime_keeps_default():
+    stream = parse_sdp(_audio_sdp(b"L24/48000/1", b"bogus"))
+
+    assert stream is not None
+    assert stream.ptime == 1.0
+    assert stream.samples_per_packet == 48
+
+
+def test_default_channel_labels():
+    assert parse_sdp(_audio_sdp(b"L24/48000/1")).channel_labels == ("M",)
+    assert parse_sdp(_audio_sdp(b"L24/48000/2")).channel_labels == ("L", "R")
+    assert parse_sdp(_audio_sdp(b"L24/48000/4")).channel_labels == (
+        "Ch 1", "Ch 2", "Ch 3", "Ch 4"
+    )
+
+
+def test_non_audio_session_rejected():
+    video = (
+        b"v=0\n"
+        b"o=- 1 2 IN IP4 10.0.0.1\n"
+        b"s=camera\n"
+        b"c=IN IP4 239.1.1.9\n"
+        b"t=0 0\n"
+        b"m=video 5000 RTP/AVP 96\n"
+        b"a=rtpmap:96 raw/90000\n"
+    )
+    assert parse_sdp(video) is None
+
+
+def test_missing_connection_or_port_rejected():
+    no_port = _audio_sdp(b"L24/48000/2").replace(b"m=audio 7000", b"m=audio 0")
+    assert parse_sdp(no_port) is None
+
+    no_conn = _audio_sdp(b"L24/48000/2").replace(b"c=IN IP4 239.1.1.4\n", b"")
+    assert parse_sdp(no_conn) is None
@@ -7,6 +7,9 @@
 import { defineStore } from 'pinia'
 import { ref, computed } from 'vue'
 
+// Level frames arrive as binary UTF-8 JSON; control messages as text
+const textDecoder = new TextDecoder()
+
 export const useCaptureStore = defineStore('capture', () => {
   // State
   const status = ref({
@@ -233,9 +236,12 @@ export const useCaptureStore = defineStore('capture', () => {
     const wsUrl = `${protocol}//${window.location.host}/ws/levels`
 
     levelsWebSocket = new WebSocket(wsUrl)
+    levelsWebSocket.binaryType = 'arraybuffer'
 
     levelsWebSocket.onmessage = (event) => {
-      const data = JSON.parse(event.data)
+      const data = JSON.parse(
+        typeof event.data === 'string' ? event.data : textDecoder.decode(event.data)
+      )
       if (data.type === 'levels') {
         levels.value = data.channels
       }
@@ -7,6 +7,9 @@
 import { defineStore } from 'pinia'
 import { ref, computed } from 'vue'
 
+// Level frames arrive as binary UTF-8 JSON; control messages as text
+const textDecoder = new TextDecoder()
+
 export const useRecordersStore = defineStore('recorders', () => {
   // State
   const recorders = ref([])
@@ -233,6 +236,7 @@ export const useRecordersStore = defineStore('recorders', () => {
     const wsUrl = `${protocol}//${window.location.host}/ws/levels`
 
     levelsWebSocket = new WebSocket(wsUrl)
+    levelsWebSocket.binaryType = 'arraybuffer'
 
     levelsWebSocket.onopen = () => {
       connected.value = true
@@ -241,7 +245,9 @@ export const useRecordersStore = defineStore('recorders', () => {
     }
 
     levelsWebSocket.onmessage = (event) => {
-      const data = JSON.parse(event.data)
+      const data = JSON.parse(
+        typeof event.data === 'string' ? event.data : textDecoder.decode(event.data)
+      )
       if (data.type === 'all_levels') {
         // Update levels for each recorder
         for (const recorderData of data.recorders) {